@@ -1,29 +1,72 @@
 __version__ = "0.1.5"
 
+import importlib
+from typing import TYPE_CHECKING
 
-# import clients
-from agents.client.client import LocalClient, create_client
-
-# # imports for easier access
-from agents.schemas.agent import AgentState
-from agents.schemas.block import Block
-from agents.schemas.embedding_config import EmbeddingConfig
-from agents.schemas.enums import JobStatus
-from agents.schemas.llm_config import LLMConfig
-from agents.schemas.memory import (
-    ArchivalMemorySummary,
-    BasicBlockMemory,
-    ChatMemory,
-    Memory,
-    RecallMemorySummary,
-)
-from agents.schemas.message import Message
-from agents.schemas.agents_message import AgentsMessage
-from agents.schemas.openai.chat_completion_response import UsageStatistics
-from agents.schemas.organization import Organization
-from agents.schemas.tool import Tool
-from agents.schemas.usage import AgentsUsageStatistics
-from agents.schemas.user import User
-
-# Import the new SDK interface
-from agents.sdk import Agents
+# Public names are resolved on first access (PEP 562) so that `import agents`,
+# or importing any submodule such as the migration scripts, does not build the
+# client, the SDK and every schema up front.
+_LAZY_ATTRS = {
+    # clients
+    "LocalClient": "agents.client.client",
+    "create_client": "agents.client.client",
+    # imports for easier access
+    "AgentState": "agents.schemas.agent",
+    "Block": "agents.schemas.block",
+    "EmbeddingConfig": "agents.schemas.embedding_config",
+    "JobStatus": "agents.schemas.enums",
+    "LLMConfig": "agents.schemas.llm_config",
+    "ArchivalMemorySummary": "agents.schemas.memory",
+    "BasicBlockMemory": "agents.schemas.memory",
+    "ChatMemory": "agents.schemas.memory",
+    "Memory": "agents.schemas.memory",
+    "RecallMemorySummary": "agents.schemas.memory",
+    "Message": "agents.schemas.message",
+    "AgentsMessage": "agents.schemas.agents_message",
+    "UsageStatistics": "agents.schemas.openai.chat_completion_response",
+    "Organization": "agents.schemas.organization",
+    "Tool": "agents.schemas.tool",
+    "AgentsUsageStatistics": "agents.schemas.usage",
+    "User": "agents.schemas.user",
+    # the SDK interface
+    "Agents": "agents.sdk",
+}
+
+__all__ = ["__version__", *_LAZY_ATTRS]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+if TYPE_CHECKING:
+    from agents.client.client import LocalClient, create_client
+    from agents.schemas.agent import AgentState
+    from agents.schemas.block import Block
+    from agents.schemas.embedding_config import EmbeddingConfig
+    from agents.schemas.enums import JobStatus
+    from agents.schemas.llm_config import LLMConfig
+    from agents.schemas.memory import (
+        ArchivalMemorySummary,
+        BasicBlockMemory,
+        ChatMemory,
+        Memory,
+        RecallMemorySummary,
+    )
+    from agents.schemas.message import Message
+    from agents.schemas.agents_message import AgentsMessage
+    from agents.schemas.openai.chat_completion_response import UsageStatistics
+    from agents.schemas.organization import Organization
+    from agents.schemas.tool import Tool
+    from agents.schemas.usage import AgentsUsageStatistics
+    from agents.schemas.user import User
+    from agents.sdk import Agents
@@ -1,13 +1,36 @@
 # Agent module for Mirix
 # This module contains all agent-related functionality
+#
+# Every export is resolved lazily (PEP 562): each agent drags in the ORM, the
+# LLM clients and image libraries, so importing one of them should not pay for
+# all of them.
 
-from . import app_constants, app_utils
-from .agent_configs import AGENT_CONFIGS
-from .agent_states import AgentStates
-from .agent_wrapper import AgentWrapper
-from .message_queue import MessageQueue
-from .temporary_message_accumulator import TemporaryMessageAccumulator
-from .upload_manager import UploadManager
+import importlib
+from typing import TYPE_CHECKING
+
+# export name -> module that defines it
+_LAZY_ATTRS = {
+    "AGENT_CONFIGS": "agents.agent.agent_configs",
+    "AgentStates": "agents.agent.agent_states",
+    "AgentWrapper": "agents.agent.agent_wrapper",
+    "MessageQueue": "agents.agent.message_queue",
+    "TemporaryMessageAccumulator": "agents.agent.temporary_message_accumulator",
+    "UploadManager": "agents.agent.upload_manager",
+    "Agent": "agents.agent.agent",
+    "AgentState": "agents.agent.agent",
+    "save_agent": "agents.agent.agent",
+    "BackgroundAgent": "agents.agent.background_agent",
+    "CoreMemoryAgent": "agents.agent.core_memory_agent",
+    "EpisodicMemoryAgent": "agents.agent.episodic_memory_agent",
+    "KnowledgeVaultAgent": "agents.agent.knowledge_vault_agent",
+    "MetaMemoryAgent": "agents.agent.meta_memory_agent",
+    "ProceduralMemoryAgent": "agents.agent.procedural_memory_agent",
+    "ReflexionAgent": "agents.agent.reflexion_agent",
+    "ResourceMemoryAgent": "agents.agent.resource_memory_agent",
+    "SemanticMemoryAgent": "agents.agent.semantic_memory_agent",
+}
+
+_LAZY_SUBMODULES = ("app_constants", "app_utils")
 
 __all__ = [
     "AgentWrapper",
@@ -20,13 +43,39 @@ __all__ = [
     "app_utils",
 ]
 
-from agents.agent.agent import Agent, AgentState, save_agent
-from agents.agent.background_agent import BackgroundAgent
-from agents.agent.core_memory_agent import CoreMemoryAgent
-from agents.agent.episodic_memory_agent import EpisodicMemoryAgent
-from agents.agent.knowledge_vault_agent import KnowledgeVaultAgent
-from agents.agent.meta_memory_agent import MetaMemoryAgent
-from agents.agent.procedural_memory_agent import ProceduralMemoryAgent
-from agents.agent.reflexion_agent import ReflexionAgent
-from agents.agent.resource_memory_agent import ResourceMemoryAgent
-from agents.agent.semantic_memory_agent import SemanticMemoryAgent
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_SUBMODULES))
+
+
+if TYPE_CHECKING:
+    from . import app_constants, app_utils
+    from .agent_configs import AGENT_CONFIGS
+    from .agent_states import AgentStates
+    from .agent_wrapper import AgentWrapper
+    from .message_queue import MessageQueue
+    from .temporary_message_accumulator import TemporaryMessageAccumulator
+    from .upload_manager import UploadManager
+
+    from agents.agent.agent import Agent, AgentState, save_agent
+    from agents.agent.background_agent import BackgroundAgent
+    from agents.agent.core_memory_agent import CoreMemoryAgent
+    from agents.agent.episodic_memory_agent import EpisodicMemoryAgent
+    from agents.agent.knowledge_vault_agent import KnowledgeVaultAgent
+    from agents.agent.meta_memory_agent import MetaMemoryAgent
+    from agents.agent.procedural_memory_agent import ProceduralMemoryAgent
+    from agents.agent.reflexion_agent import ReflexionAgent
+    from agents.agent.resource_memory_agent import ResourceMemoryAgent
+    from agents.agent.semantic_memory_agent import SemanticMemoryAgent
@@ -1,95 +1,360 @@
+import asyncio
+import hashlib
 import logging
-import base64
+import mimetypes
 import os
-from uuid import UUID
-from typing import Optional, List
+import sqlite3
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, List, Tuple
 
+try:
+    import pybase64
+except ImportError:  # optional SIMD base64; the stdlib module has the same API
+    import base64 as pybase64
+
+try:
+    import xxhash
+except ImportError:  # optional; BLAKE2b-128 is used instead
+    xxhash = None
+
+from agents.helpers.async_helpers import AsyncTokenBucket, run_sync
 from agents.schemas.frame import Frame
 from agents.schemas.llm_config import LLMConfig
 from agents.llm_api.llm_client import LLMClient
-from agents.settings import model_settings
+from agents.settings import settings
 from agents.schemas.message import Message
 from agents.schemas.enums import MessageRole
 from agents.schemas.agents_message_content import TextContent, ImageContent
 
 logger = logging.getLogger(__name__)
 
+# Read size for streaming base64 encoding. 57 KiB is a multiple of 3, so each
+# chunk encodes to complete base64 quanta and no padding leaks between chunks.
+ENCODE_CHUNK_SIZE = 57 * 1024
+
+# Frames whose perceptual hashes differ in at most this many bits share a summary
+PHASH_MAX_DISTANCE = 4
+
+# Recent perceptual hashes kept in memory for near-duplicate lookups
+PHASH_WINDOW = 256
+
+
+@lru_cache(maxsize=8)
+def _encode_file(image_path: str, mtime_ns: int) -> str:
+    """Base64-encode a file chunk by chunk; cached on (path, mtime) so retries reuse it."""
+    buf = bytearray()
+    with open(image_path, "rb") as image_file:
+        while chunk := image_file.read(ENCODE_CHUNK_SIZE):
+            buf += pybase64.b64encode(chunk)
+    return buf.decode("ascii")
+
+
+def _content_hash(image_path: str) -> str:
+    """128-bit hex digest of a file's bytes (xxh3_128 if available, else BLAKE2b)."""
+    hasher = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    with open(image_path, "rb") as image_file:
+        while chunk := image_file.read(ENCODE_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class FrameSummaryCache:
+    """
+    SQLite-backed cache of frame summaries keyed by image content hash.
+
+    Exact matches are looked up by hash. Near-duplicates (e.g. the same screen
+    with the cursor moved) are matched on the capture-side 64-bit perceptual hash
+    against a window of recently stored frames, within `PHASH_MAX_DISTANCE` bits.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or settings.agents_dir / "frame_summaries.db")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Accessed from asyncio.to_thread workers; every use holds the lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS frame_summaries ("
+            "hash TEXT PRIMARY KEY, phash64 INTEGER, summary TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._recent: "deque[Tuple[int, str]]" = deque(maxlen=PHASH_WINDOW)
+
+    def get(self, content_hash: str, phash64: Optional[int] = None) -> Optional[str]:
+        """Return a cached summary for the content hash or a near-identical frame."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM frame_summaries WHERE hash = ?", (content_hash,)
+            ).fetchone()
+            if row:
+                return row[0]
+            if phash64 is not None:
+                for recent_phash, summary in reversed(self._recent):
+                    # Mask to 64 bits: phash64 is stored as a signed BIGINT
+                    distance = bin((recent_phash ^ phash64) & 0xFFFFFFFFFFFFFFFF).count("1")
+                    if distance <= PHASH_MAX_DISTANCE:
+                        return summary
+        return None
+
+    def put(self, content_hash: str, summary: str, phash64: Optional[int] = None) -> None:
+        """Store a summary; an existing entry for the same hash is kept."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO frame_summaries (hash, phash64, summary) VALUES (?, ?, ?)",
+                (content_hash, phash64, summary),
+            )
+            self._conn.commit()
+            if phash64 is not None:
+                self._recent.append((phash64, summary))
+
+
 class VisionAgent:
-    def __init__(self, model: str = "gpt-4o"):
+    def __init__(
+        self,
+        model: str = "gpt-4o",
+        max_batch: int = 16,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[float] = None,
+        summary_cache: Optional[FrameSummaryCache] = None,
+        cache_summaries: bool = False,
+    ):
         # Configure the LLM
         self.config = LLMConfig.default_config(model)
-        
+
         # Use the client factory
         self.client = LLMClient.create(self.config)
         if not self.client:
             raise ValueError(f"Failed to create LLM client for model {model}")
 
+        # Frames are submitted in chunks of `max_batch`, with at most
+        # `max_concurrency` requests in flight against the provider at once.
+        self.max_batch = max(1, max_batch)
+        self.max_concurrency = max(1, max_concurrency)
+
+        # Optional request rate cap (token bucket, bursts up to max_concurrency);
+        # None leaves pacing to the provider's own rate limits
+        self.requests_per_minute = requests_per_minute
+        self._rate_limit: Optional[Tuple[asyncio.AbstractEventLoop, AsyncTokenBucket]] = None
+
+        # Opt-in: summaries of unchanged or near-identical frames are reused
+        # across retries and restarts instead of calling the LLM again. Off by
+        # default, since the cache is a local SQLite file under agents_dir
+        self.summary_cache = summary_cache
+        if self.summary_cache is None and cache_summaries:
+            try:
+                self.summary_cache = FrameSummaryCache()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Frame summary cache disabled: {e}")
+
+    def _rate_limiter(self) -> Optional[AsyncTokenBucket]:
+        """
+        Token bucket for the running event loop, or None without a rate cap.
+        The sync wrappers run each call on a fresh loop, and the bucket's lock
+        cannot be shared across loops, so a new loop gets a new bucket.
+        """
+        if not self.requests_per_minute:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._rate_limit is None or self._rate_limit[0] is not loop:
+            bucket = AsyncTokenBucket(self.max_concurrency, self.requests_per_minute / 60)
+            self._rate_limit = (loop, bucket)
+        return self._rate_limit[1]
+
     def encode_image(self, image_path: str) -> str:
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+        return _encode_file(image_path, os.stat(image_path).st_mtime_ns)
 
-    def summarize_frame(self, frame: Frame) -> Optional[str]:
+    def _build_message(self, frame: Frame) -> Optional[Message]:
         """
-        Generate a summary for the frame using the LLM.
+        Build the vision request message for a frame, or None if its image is missing.
         """
-        if not frame.image_ref or not os.path.exists(frame.image_ref):
+        is_remote = bool(frame.image_ref) and frame.image_ref.startswith(("http://", "https://"))
+        if not frame.image_ref or not (is_remote or os.path.exists(frame.image_ref)):
             logger.warning(f"Image not found for frame {frame.id}: {frame.image_ref}")
             return None
 
+        prompt_text = (
+            f"Analyze this screen capture from the application '{frame.app_name}'. "
+            f"Window title: '{frame.window_title}'. "
+            f"OCR Text: '{frame.ocr_text[:500] if frame.ocr_text else ''}...'. "
+            "Provide a concise summary of what the user is doing or what is visible."
+        )
+
+        # The client converters send `image_id` as-is when it is a URL or data URI,
+        # so remote frames are passed by URL and local ones inlined without
+        # registering a file record per capture
+        if is_remote:
+            image_id = frame.image_ref
+        else:
+            mime_type = mimetypes.guess_type(frame.image_ref)[0] or "image/jpeg"
+            image_id = f"data:{mime_type};base64,{self.encode_image(frame.image_ref)}"
+
+        return Message(
+            role=MessageRole.user,
+            content=[
+                TextContent(text=prompt_text),
+                ImageContent(image_id=image_id)
+            ]
+        )
+
+    async def asummarize_frame(self, frame: Frame) -> Optional[str]:
+        """
+        Generate a summary for the frame using the LLM, without blocking the event loop.
+        """
         try:
-            base64_image = self.encode_image(frame.image_ref)
-            
-            prompt_text = (
-                f"Analyze this screen capture from the application '{frame.app_name}'. "
-                f"Window title: '{frame.window_title}'. "
-                f"OCR Text: '{frame.ocr_text[:500] if frame.ocr_text else ''}...'. "
-                "Provide a concise summary of what the user is doing or what is visible."
-            )
-            
-            # Construct the message using the defined schemas
-            # Note: ImageContent expects image_id usually for DB ref, but some clients might handle base64/url if configured?
-            # Looking at `to_openai_dict` in Message, it handles ImageContent by using `image_id`.
-            # If we want to pass base64, we might need to use a specific way or 'hack' it if the client doesn't support direct base64 injection via ImageContent.
-            # OpenAI API supports base64 data URLs.
-            # Let's see if LLMClientBase supports base64.
-            
-            # For now, we will try to manually construct a message that the client accepts if Message schema is too strict or DB-bound.
-            # But send_llm_request expects List[Message].
-            
-            # If ImageContent only stores ID, we might need to upload it or use a custom content type?
-            # Wait, `to_openai_dict` checks `ImageContent` and puts `image_url`.
-            # But `ImageContent` in `agents_message_content.py` likely just has `image_id`.
-            
-            # Let's check ImageContent definition.
-            # It seems it only has image_id.
-            # If so, the system expects images to be in a storage/DB.
-            # But we are in a "Frame Processor" context where images are on disk.
-            
-            # I'll assume for this prototype that I can pass a base64 data URI as the 'image_id' if the client allows it, 
-            # OR I might need to modify the client/message structure.
-            
-            # Actually, `to_anthropic_dict` logic:
-            # `{"type": "image_url", "image_id": content_part.image_id}`
-            # It doesn't look like it resolves to base64 automatically unless `image_id` IS the url/base64.
-            
-            # Let's try passing the data URI as the image_id.
-            data_uri = f"data:image/jpeg;base64,{base64_image}"
-            
-            message = Message(
-                role=MessageRole.user,
-                content=[
-                    TextContent(text=prompt_text),
-                    ImageContent(image_id=data_uri) 
-                ]
-            )
-            
-            # Call the client
-            response = self.client.send_llm_request(messages=[message])
-            
+            content_hash = None
+            if self.summary_cache is not None and frame.image_ref and os.path.exists(frame.image_ref):
+                content_hash = await asyncio.to_thread(_content_hash, frame.image_ref)
+                cached = await asyncio.to_thread(self.summary_cache.get, content_hash, frame.phash64)
+                if cached is not None:
+                    return cached
+
+            # Image registration/encoding touches the disk and the file store
+            message = await asyncio.to_thread(self._build_message, frame)
+            if message is None:
+                return None
+
+            rate_limiter = self._rate_limiter()
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+
             # Response is ChatCompletionResponse
-            # It has choices[0].message.content
-            return response.choices[0].message.content
-                 
+            response = await self.client.send_llm_request_async(messages=[message])
+            summary = response.choices[0].message.content
+
+            if content_hash is not None and summary:
+                await asyncio.to_thread(self.summary_cache.put, content_hash, summary, frame.phash64)
+            return summary
+
         except Exception as e:
             logger.error(f"Error summarizing frame {frame.id}: {e}")
             return None
+
+    async def asummarize_frames(self, frames: List[Frame]) -> List[Optional[str]]:
+        """
+        Generate summaries for a list of frames using the LLM.
+
+        Frames are grouped into chunks of `max_batch`; within a chunk, at most
+        `max_concurrency` requests are in flight at once, so network round-trips and
+        disk reads overlap instead of running back to back. The result list is
+        aligned with `frames`; entries are None for frames that could not be summarized.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(frame: Frame) -> Optional[str]:
+            async with semaphore:
+                return await self.asummarize_frame(frame)
+
+        summaries: List[Optional[str]] = []
+        for start in range(0, len(frames), self.max_batch):
+            chunk = frames[start:start + self.max_batch]
+            summaries.extend(await asyncio.gather(*(_bounded(f) for f in chunk)))
+        return summaries
+
+    def summarize_frames(self, frames: List[Frame]) -> List[Optional[str]]:
+        """
+        Synchronous wrapper around `asummarize_frames`; safe to call from code
+        running inside an event loop (see run_sync).
+        """
+        if not frames:
+            return []
+        return run_sync(self.asummarize_frames(frames))
+
+    def summarize_frame(self, frame: Frame) -> Optional[str]:
+        """
+        Generate a summary for the frame using the LLM; a one-frame batch.
+        """
+        return self.summarize_frames([frame])[0]
+
+
+@dataclass
+class HierarchicalSummary:
+    """Per-frame, per-group and session-level summaries for a run of frames."""
+
+    frame_summaries: List[Optional[str]] = field(default_factory=list)
+    group_summaries: List[str] = field(default_factory=list)
+    session_summary: Optional[str] = None
+
+
+class HierarchicalFrameSummarizer:
+    """
+    Two-level summarizer: frames are summarized in windows of `batch_size` with the
+    vision model, then every `group_size` micro-summaries are condensed with a
+    text-only call. Only the short group summaries are combined into the session
+    summary, so prompt size stays bounded as sessions grow.
+    """
+
+    def __init__(
+        self,
+        vision_agent: Optional[VisionAgent] = None,
+        batch_size: int = 16,
+        group_size: int = 10,
+        text_model: str = "gpt-4o-mini",
+    ):
+        self.vision_agent = vision_agent or VisionAgent()
+        self.batch_size = max(1, batch_size)
+        self.group_size = max(1, group_size)
+
+        self.text_config = LLMConfig.default_config(text_model)
+        self.text_client = LLMClient.create(self.text_config)
+        if not self.text_client:
+            raise ValueError(f"Failed to create LLM client for model {text_model}")
+
+    async def _condense(self, summaries: List[str]) -> Optional[str]:
+        """Condense a list of summaries into one with a text-only LLM call."""
+        if not summaries:
+            return None
+        if len(summaries) == 1:
+            return summaries[0]
+
+        bullet_list = "\n".join(f"- {s}" for s in summaries)
+        prompt_text = (
+            "The following are chronological summaries of a user's screen activity:\n"
+            f"{bullet_list}\n"
+            "Condense them into a short summary of what the user was working on."
+        )
+        message = Message(role=MessageRole.user, content=[TextContent(text=prompt_text)])
+
+        try:
+            response = await self.text_client.send_llm_request_async(messages=[message])
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"Error condensing {len(summaries)} summaries: {e}")
+            return None
+
+    async def asummarize(self, frames: List[Frame]) -> HierarchicalSummary:
+        """
+        Summarize a session's frames at frame, group and session granularity.
+        """
+        result = HierarchicalSummary()
+
+        # Phase 1: per-frame micro-summaries. Frames the vision worker already
+        # summarized keep their stored vision_summary; only the rest are sent
+        # to the vision model, in fixed-size windows.
+        result.frame_summaries = [frame.vision_summary or None for frame in frames]
+        pending = [i for i, summary in enumerate(result.frame_summaries) if summary is None]
+        for start in range(0, len(pending), self.batch_size):
+            indices = pending[start:start + self.batch_size]
+            window = [frames[i] for i in indices]
+            summaries = await self.vision_agent.asummarize_frames(window)
+            for i, summary in zip(indices, summaries, strict=True):
+                result.frame_summaries[i] = summary
+
+        # Phase 2: condense groups of micro-summaries (text only, no images)
+        micro = [s for s in result.frame_summaries if s]
+        groups = [micro[i:i + self.group_size] for i in range(0, len(micro), self.group_size)]
+        condensed = await asyncio.gather(*(self._condense(group) for group in groups))
+        result.group_summaries = [c for c in condensed if c]
+
+        result.session_summary = await self._condense(result.group_summaries)
+        return result
+
+    def summarize(self, frames: List[Frame]) -> HierarchicalSummary:
+        """
+        Synchronous wrapper around `asummarize`; safe to call from code running
+        inside an event loop (see run_sync).
+        """
+        return run_sync(self.asummarize(frames))
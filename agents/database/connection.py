@@ -1,31 +1,168 @@
-import asyncio
 import logging
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Generator, Optional
+import threading
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Generator, Iterable, Optional, Sequence
 
 import asyncpg
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+try:
+    import orjson
+except ImportError:  # optional; SQLAlchemy falls back to the stdlib json module
+    orjson = None
 
+from agents.errors import AgentsConfigurationError
 from agents.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Create engine
-# Use settings.agents_pg_uri which constructs the URI from env vars or defaults
-# We use pool_pre_ping=True to handle disconnected sessions
-engine = create_engine(
-    settings.agents_pg_uri,
-    pool_size=settings.pg_pool_size,
-    max_overflow=settings.pg_max_overflow,
-    pool_timeout=settings.pg_pool_timeout,
-    pool_recycle=settings.pg_pool_recycle,
-    pool_pre_ping=True,
-    echo=settings.pg_echo,
-)
+# Drivers that only work with SQLAlchemy's asyncio extension. Used under a sync
+# engine, QueuePool blocks on greenlet-less awaits and deadlocks under load.
+ASYNC_DRIVERS = ("asyncpg", "asyncmy", "aiosqlite", "aiomysql", "psycopg_async")
+
+
+def _build_sync_uri() -> str:
+    """Return the configured URI, rejecting async drivers for the sync engine."""
+    url = make_url(settings.agents_pg_uri)
+    driver = url.drivername.split("+", 1)[1] if "+" in url.drivername else ""
+    if driver in ASYNC_DRIVERS:
+        raise AgentsConfigurationError(
+            f"Database URI uses async driver '{url.drivername}', which cannot back the "
+            "sync engine. Use a sync driver (e.g. postgresql+pg8000) in the URI; "
+            "async access goes through async_engine."
+        )
+    return settings.agents_pg_uri
+
+
+def _build_async_uri() -> str:
+    """Convert the configured URI to the asyncpg dialect for the async engine."""
+    url = make_url(settings.agents_pg_uri)
+    base_driver = url.drivername.split("+", 1)[0]
+    return url.set(drivername=f"{base_driver}+asyncpg").render_as_string(hide_password=False)
+
+
+def get_libpq_dsn() -> str:
+    """
+    Return the configured URI as a plain postgresql:// DSN.
+
+    For connections opened outside the pools (asyncpg.connect, psycopg2.connect),
+    e.g. the dedicated session-scoped connections the workers LISTEN on.
+    """
+    url = make_url(settings.agents_pg_uri)
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(class_=AsyncSession, expire_on_commit=False)
+
+# Engines are created on first use, so importing this module (e.g. from the
+# migration scripts) neither resolves the database host nor opens a pool.
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_engine_lock = threading.Lock()
+
+
+def _install_pool_status_logging(pool, label: str) -> None:
+    """Log pool.status() on checkout, at most once per pg_pool_status_interval seconds."""
+    interval = settings.pg_pool_status_interval
+    if interval <= 0:
+        return
+    last_logged = [0.0]
+
+    @event.listens_for(pool, "checkout")
+    def _log_pool_status(dbapi_connection, connection_record, connection_proxy):
+        now = time.monotonic()
+        if now - last_logged[0] >= interval:
+            last_logged[0] = now
+            logger.info("DB pool status (%s): %s", label, pool.status())
+
+
+def _async_engine_kwargs() -> dict:
+    """asyncpg connect arguments and JSON codecs for the async engine."""
+    kwargs = {
+        "connect_args": {
+            "command_timeout": settings.pg_pool_timeout,
+            # asyncpg's own statement cache; 0 lifetime keeps entries until eviction
+            "statement_cache_size": settings.pg_statement_cache_size,
+            "max_cached_statement_lifetime": 0,
+            # SQLAlchemy's prepared-statement cache on top of asyncpg
+            "prepared_statement_cache_size": settings.pg_statement_cache_size,
+        },
+    }
+    if orjson is not None:
+        # The asyncpg dialect registers binary json/jsonb codecs on connect that
+        # call these, so raw worker connections decode jsonb without a text round
+        kwargs["json_serializer"] = lambda obj: orjson.dumps(obj).decode()
+        kwargs["json_deserializer"] = orjson.loads
+    return kwargs
+
+
+def get_engine() -> Engine:
+    """Return the sync engine, creating it and binding SessionLocal on first call."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                # Use settings.agents_pg_uri which constructs the URI from env vars or defaults
+                # We use pool_pre_ping=True to handle disconnected sessions
+                engine = create_engine(
+                    _build_sync_uri(),
+                    pool_size=settings.pg_pool_size,
+                    max_overflow=settings.pg_max_overflow,
+                    pool_timeout=settings.pg_pool_timeout,
+                    pool_recycle=settings.pg_pool_recycle,
+                    pool_pre_ping=True,
+                    pool_use_lifo=settings.pg_pool_use_lifo,
+                    echo=settings.pg_echo,
+                )
+                _install_pool_status_logging(engine.pool, "sync")
+                SessionLocal.configure(bind=engine)
+                _engine = engine
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the async engine, creating it and binding AsyncSessionLocal on first call."""
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                async_engine = create_async_engine(
+                    _build_async_uri(),
+                    poolclass=AsyncAdaptedQueuePool,
+                    pool_size=settings.pg_pool_size,
+                    max_overflow=settings.pg_max_overflow,
+                    pool_timeout=settings.pg_pool_timeout,
+                    pool_recycle=settings.pg_pool_recycle,
+                    pool_pre_ping=True,
+                    pool_use_lifo=settings.pg_pool_use_lifo,
+                    echo=settings.pg_echo,
+                    **_async_engine_kwargs(),
+                )
+                _install_pool_status_logging(async_engine.sync_engine.pool, "async")
+                AsyncSessionLocal.configure(bind=async_engine)
+                _async_engine = async_engine
+    return _async_engine
+
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def __getattr__(name: str):
+    # Keep `from agents.database.connection import engine` working
+    if name == "engine":
+        return get_engine()
+    if name == "async_engine":
+        return get_async_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -33,6 +170,7 @@ def get_db() -> Generator[Session, None, None]:
     Dependency for getting a database session.
     Yields a Session object and ensures it's closed after use.
     """
+    get_engine()
     db = SessionLocal()
     try:
         yield db
@@ -45,7 +183,7 @@ def verify_connection() -> bool:
     Verifies that the database connection is working.
     """
     try:
-        with engine.connect() as connection:
+        with get_engine().connect() as connection:
             # Simple query to check connection
             from sqlalchemy import text
             connection.execute(text("SELECT 1"))
@@ -55,57 +193,88 @@ def verify_connection() -> bool:
         return False
 
 
-def _build_async_dsn() -> str:
-    """Convert the configured SQLAlchemy URI into a DSN compatible with asyncpg."""
-    url = make_url(settings.agents_pg_uri)
-    base_driver = url.drivername.split("+", 1)[0]
-    async_url = url.set(drivername=base_driver)
-    return async_url.render_as_string(hide_password=False)
-
-
-_ASYNC_DSN = _build_async_dsn()
-_async_pool: Optional[asyncpg.Pool] = None
-_pool_lock = asyncio.Lock()
-
-
-async def _get_async_pool() -> asyncpg.Pool:
-    global _async_pool
-    if _async_pool is None:
-        async with _pool_lock:
-            if _async_pool is None:
-                parsed = make_url(settings.agents_pg_uri)
-                logger.info(
-                    "Initializing asyncpg pool (host=%s db=%s)",
-                    parsed.host,
-                    parsed.database,
-                )
-                _async_pool = await asyncpg.create_pool(
-                    dsn=_ASYNC_DSN,
-                    min_size=1,
-                    max_size=settings.pg_pool_size,
-                    timeout=settings.pg_pool_timeout,
-                    command_timeout=settings.pg_pool_timeout,
-                )
-    return _async_pool
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Async counterpart of get_db: yields an AsyncSession and closes it after use.
+    """
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
 
 
 @asynccontextmanager
 async def get_db_connection() -> AsyncIterator[asyncpg.Connection]:
-    """Yield an asyncpg connection from the shared pool."""
-    pool = await _get_async_pool()
-    connection = await pool.acquire()
-    try:
-        yield connection
-    finally:
-        await pool.release(connection)
+    """
+    Yield a raw asyncpg connection checked out from the async engine's pool.
+
+    Sharing async_engine's pool keeps a single set of server connections and
+    coherent pool metrics, while still exposing asyncpg-specific APIs (COPY,
+    LISTEN/NOTIFY, prepared statements) to the workers.
+    """
+    async with get_async_engine().connect() as conn:
+        raw = await conn.get_raw_connection()
+        yield raw.driver_connection
 
 
 async def verify_async_connection() -> bool:
     """Verify the async connection path by running a lightweight query."""
     try:
-        async with get_db_connection() as conn:
-            await conn.execute("SELECT 1")
+        async with get_async_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
         return True
     except Exception as exc:
         logger.error("Async database connection failed: %s", exc)
         return False
+
+
+async def warm_async_pool(size: Optional[int] = None) -> None:
+    """
+    Open `size` async pool connections up front (default pg_pool_warm_size).
+
+    The pool otherwise connects lazily, so a worker's first batches would pay
+    TCP + auth + codec setup on the hot path. Connections are held together so
+    each checkout opens a distinct one. Best effort: failures are only logged.
+    """
+    size = settings.pg_pool_warm_size if size is None else size
+    if size <= 0:
+        return
+    try:
+        async with AsyncExitStack() as stack:
+            for _ in range(size):
+                await stack.enter_async_context(get_async_engine().connect())
+        logger.debug("Warmed %d async pool connections", size)
+    except Exception as e:
+        logger.warning("Async pool warm-up failed: %s", e)
+
+
+async def bulk_copy_records(
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[tuple],
+    conn: Optional[asyncpg.Connection] = None,
+) -> int:
+    """
+    Bulk-insert rows with COPY ... FROM STDIN in asyncpg's binary format.
+
+    Orders of magnitude faster than per-row INSERTs or ORM session.add() for
+    batched writes (frames, ocr_text, secrets, day summaries). Values must be
+    native Python types matching the column types; bytea columns take raw
+    `bytes` as-is.
+
+    Args:
+        table: Target table name
+        columns: Column names, in the order of each record tuple
+        records: Row tuples to insert
+        conn: Connection to copy on (e.g. to share a transaction); a pooled
+            connection is checked out when omitted
+
+    Returns:
+        Number of rows copied
+    """
+    if conn is None:
+        async with get_db_connection() as pooled:
+            return await bulk_copy_records(table, columns, records, conn=pooled)
+
+    status = await conn.copy_records_to_table(table, records=records, columns=list(columns))
+    # Status is the command tag, e.g. "COPY 1000"
+    return int(status.split()[-1])
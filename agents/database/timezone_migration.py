@@ -7,9 +7,50 @@ NOTE: This script is for SQLite databases only. For PostgreSQL, use
 migrate_database_postgresql.sql or the timezone_migration_postgresql.py script.
 """
 
+import logging
 import sqlite3
+import sys
 from datetime import datetime, timezone
 
+try:
+    from tqdm import tqdm
+except ImportError:  # optional progress bar
+    tqdm = None
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched and updates flushed per round trip in the fallback path
+BATCH_SIZE = 10_000
+
+# Settings applied for the duration of the migration
+BULK_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = OFF;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -262144;
+PRAGMA locking_mode = EXCLUSIVE;
+"""
+# Those of them read beforehand and set back afterwards; journal_mode is
+# persisted in the database file, so a WAL database must stay WAL
+RESTORED_PRAGMAS = ("synchronous", "journal_mode", "locking_mode")
+
+
+def _naive_iso_predicate(col_name: str) -> str:
+    """
+    SQL predicate matching canonical naive 'YYYY-MM-DDTHH:MM:SS[.ffffff]' values in a column.
+
+    For these, appending '+00:00' gives exactly what the Python fallback's
+    `fromisoformat(...).replace(tzinfo=utc).isoformat()` would store. Other
+    naive shapes (a space separator, short fractions, '.000000') are
+    normalized by isoformat, so they are left to the fallback.
+    """
+    return (
+        f"{col_name} IS NOT NULL "
+        f"AND substr({col_name}, 1, 19) GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]T[0-9][0-9]:[0-9][0-9]:[0-9][0-9]' "
+        f"AND (length({col_name}) = 19 OR (length({col_name}) = 26 AND substr({col_name}, 20, 1) = '.' "
+        f"AND substr({col_name}, 21) GLOB '[0-9][0-9][0-9][0-9][0-9][0-9]' AND substr({col_name}, 21) != '000000'))"
+    )
+
 
 def migrate_database_inplace(db_path: str, overwrite_nulls: bool = False):
     """
@@ -21,10 +62,15 @@ def migrate_database_inplace(db_path: str, overwrite_nulls: bool = False):
                          If False (default), leave NULL values unchanged.
     """
 
-    print(f"Starting in-place migration of {db_path}")
+    logger.info(f"Starting in-place migration of {db_path}")
 
     # Connect to the database
     conn = sqlite3.connect(db_path)
+    saved_pragmas = {
+        name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in RESTORED_PRAGMAS
+    }
+    # One-shot offline migration: trade durability for speed while it runs
+    conn.executescript(BULK_PRAGMAS)
     conn.execute("PRAGMA foreign_keys = OFF")  # Disable foreign keys during migration
 
     try:
@@ -34,80 +80,139 @@ def migrate_database_inplace(db_path: str, overwrite_nulls: bool = False):
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
         tables = [row[0] for row in cursor.fetchall()]
 
+        # Progress is tallied per column and reported once at the end, rather
+        # than written to stdout line by line while the tables are rewritten
+        converted_counts = {}
+        filled_counts = {}
+        unparsable_counts = {}
+
+        # The bar only renders on a terminal; redirected runs get the summary alone
+        if tqdm is not None:
+            tables = tqdm(tables, desc="tables", unit="table", disable=not sys.stderr.isatty())
+
         for table_name in tables:
-            print(f"Processing table: {table_name}")
             cursor.execute(f"PRAGMA table_info({table_name})")
             columns = cursor.fetchall()
 
             datetime_columns = [col[1] for col in columns if col[2] == 'DATETIME']
 
             if not datetime_columns:
-                print(f"  No DATETIME columns found in {table_name}")
                 continue
 
-            for col_name in datetime_columns:
-                print(f"  Converting column: {col_name}")
-
-                # Only update NULL values if explicitly requested
-                if overwrite_nulls:
-                    conn.execute(
-                        f"UPDATE {table_name} SET {col_name} = ? WHERE {col_name} IS NULL",
-                        (datetime.now(timezone.utc).isoformat(),)
+            with conn:
+                for col_name in datetime_columns:
+                    column_key = f"{table_name}.{col_name}"
+
+                    # Only update NULL values if explicitly requested
+                    if overwrite_nulls:
+                        filled = conn.execute(
+                            f"UPDATE {table_name} SET {col_name} = ? WHERE {col_name} IS NULL",
+                            (datetime.now(timezone.utc).isoformat(),)
+                        ).rowcount
+                        if filled > 0:
+                            filled_counts[column_key] = filled
+
+                    # Naive ISO datetimes become UTC-aware by appending the offset,
+                    # in a single pass inside SQLite
+                    cursor.execute(
+                        f"UPDATE {table_name} SET {col_name} = {col_name} || '+00:00' "
+                        f"WHERE {_naive_iso_predicate(col_name)}"
                     )
-                    print(f"    - Filled NULL values with current UTC time")
-
-                # Convert existing naive datetimes to UTC-aware
-                cursor.execute(f"SELECT rowid, {col_name} FROM {table_name} WHERE {col_name} IS NOT NULL")
-                rows = cursor.fetchall()
-                converted_count = 0
-                for rowid, dt_str in rows:
-                    if dt_str:
-                        try:
-                            dt = datetime.fromisoformat(dt_str)
-                            if dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=timezone.utc)
-                                new_dt_str = dt.isoformat()
-                                conn.execute(f"UPDATE {table_name} SET {col_name} = ? WHERE rowid = ?", (new_dt_str, rowid))
-                                converted_count += 1
-                        except ValueError:
-                            print(f"    - Could not parse datetime string '{dt_str}' in table '{table_name}', column '{col_name}', rowid '{rowid}'")
-                if converted_count > 0:
-                    print(f"    - Converted {converted_count} naive datetimes to UTC")
-            conn.commit()
+                    converted_count = cursor.rowcount
+
+                    # Fall back to Python parsing for values in any other shape,
+                    # streaming rows so memory stays O(batch) rather than O(table).
+                    # Values already carrying an offset or 'Z' are filtered out in
+                    # SQL so they never reach fromisoformat.
+                    read_cursor = conn.cursor()
+                    read_cursor.arraysize = BATCH_SIZE
+                    read_cursor.execute(
+                        f"SELECT rowid, {col_name} FROM {table_name} "
+                        f"WHERE {col_name} IS NOT NULL AND NOT ({_naive_iso_predicate(col_name)}) "
+                        f"AND {col_name} NOT LIKE '%+__:__' AND {col_name} NOT LIKE '%-__:__' "
+                        f"AND {col_name} NOT LIKE '%Z'"
+                    )
+                    update_sql = f"UPDATE {table_name} SET {col_name} = ? WHERE rowid = ?"
+                    updates = []
+                    while True:
+                        batch = read_cursor.fetchmany(BATCH_SIZE)
+                        if not batch:
+                            break
+                        for rowid, dt_str in batch:
+                            if dt_str:
+                                try:
+                                    dt = datetime.fromisoformat(dt_str)
+                                    if dt.tzinfo is None:
+                                        dt = dt.replace(tzinfo=timezone.utc)
+                                        updates.append((dt.isoformat(), rowid))
+                                except ValueError:
+                                    unparsable_counts[column_key] = unparsable_counts.get(column_key, 0) + 1
+                                    logger.debug(f"Could not parse datetime string '{dt_str}' in {column_key}, rowid '{rowid}'")
+                        # Flushed inside the table's transaction: committing here
+                        # would break its atomicity while read_cursor still scans
+                        if len(updates) >= BATCH_SIZE:
+                            conn.executemany(update_sql, updates)
+                            converted_count += len(updates)
+                            updates.clear()
+                    if updates:
+                        conn.executemany(update_sql, updates)
+                        converted_count += len(updates)
+                    read_cursor.close()
+                    if converted_count > 0:
+                        converted_counts[column_key] = converted_count
 
         # Re-enable foreign keys
         conn.execute("PRAGMA foreign_keys = ON")
         conn.commit()
 
-        print("\n✅ In-place migration completed successfully!")
-        print(f"Database: {db_path}")
+        for column_key, count in filled_counts.items():
+            logger.info(f"  {column_key}: filled {count} NULL values with current UTC time")
+        for column_key, count in converted_counts.items():
+            logger.info(f"  {column_key}: converted {count} naive datetimes to UTC")
+        for column_key, count in unparsable_counts.items():
+            logger.warning(f"  {column_key}: left {count} unparsable datetime strings unchanged")
+
+        logger.info(
+            f"✅ In-place migration of {db_path} completed: "
+            f"{sum(converted_counts.values())} values converted in {len(converted_counts)} columns"
+        )
 
     except Exception as e:
-        print(f"❌ Migration failed: {e}")
+        logger.error(f"❌ Migration failed: {e}")
         conn.rollback()
         raise
     finally:
-        conn.close()
+        # A failure here (e.g. "database is locked" when leaving WAL) is logged
+        # rather than raised, so it cannot mask a migration error
+        try:
+            for name, value in saved_pragmas.items():
+                conn.execute(f"PRAGMA {name} = {value}")
+        except sqlite3.Error as e:
+            logger.error(f"Could not restore PRAGMA settings {saved_pragmas}: {e}")
+        finally:
+            conn.close()
 
 
 if __name__ == "__main__":
     import argparse
     import os
-    import sys
 
     parser = argparse.ArgumentParser(description="Apply timezone awareness to a Mirix SQLite database.")
     parser.add_argument("db_path", nargs='?', default=os.path.expanduser("~/.mirix/sqlite.db"),
                         help="Path to the SQLite database file (defaults to ~/.mirix/sqlite.db)")
     parser.add_argument("--fill-nulls", action="store_true",
                         help="Fill NULL datetime values with current UTC time (default: leave NULLs unchanged)")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Log each unparsable datetime value")
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(message)s")
+
     if not os.path.exists(args.db_path):
-        print(f"❌ Mirix database not found: {args.db_path}")
+        logger.error(f"❌ Mirix database not found: {args.db_path}")
         sys.exit(1)
 
     try:
         migrate_database_inplace(args.db_path, overwrite_nulls=args.fill_nulls)
-    except Exception as e:
-        print(f"❌ Migration failed: {e}")
+    except Exception:
         sys.exit(1)
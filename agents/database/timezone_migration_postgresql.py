@@ -8,8 +8,10 @@ column types. This script can be used to migrate existing TIMESTAMP columns
 to TIMESTAMPTZ and ensure all values are interpreted as UTC.
 """
 
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 try:
@@ -20,12 +22,96 @@ except ImportError:
     print("Install with: pip install psycopg2-binary")
     sys.exit(1)
 
+try:
+    from tqdm import tqdm
+except ImportError:  # optional progress bar
+    tqdm = None
+
+logger = logging.getLogger(__name__)
+
+# Transaction-local settings that let Postgres parallelize index rebuilds
+PARALLEL_MAINTENANCE_WORKERS = 4
+MAINTENANCE_WORK_MEM = "1GB"
+
+
+def _describe(table_name: str, columns: list[tuple[str, str]]) -> str:
+    return ", ".join(f"{table_name}.{column_name}" for column_name, _ in columns)
+
+
+def _progress(iterable, total: int):
+    """Wrap an iterable in a tqdm bar when running on a terminal."""
+    if tqdm is None:
+        return iterable
+    return tqdm(iterable, total=total, desc="tables", unit="table", disable=not sys.stderr.isatty())
+
+
+def _build_alter(
+    table_name: str, columns: list[tuple[str, str]], overwrite_nulls: bool
+) -> tuple[sql.Composed, str]:
+    """
+    Build one ALTER TABLE converting all of a table's TIMESTAMP columns to TIMESTAMPTZ.
+
+    Existing values are treated as UTC. NULLs are filled inside the same USING
+    expression so Postgres rewrites the table once instead of UPDATE + ALTER
+    rewriting it twice.
+
+    Returns:
+        The composed query and a printable version of it.
+    """
+    clauses = []
+    clause_texts = []
+    for column_name, is_nullable in columns:
+        # Use sql.Identifier to safely quote identifiers
+        column_id = sql.Identifier(column_name)
+        if overwrite_nulls and is_nullable == 'YES':
+            using_expr = sql.SQL(
+                "COALESCE({column}, NOW() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+            ).format(column=column_id)
+            using_text = f"COALESCE({column_name}, NOW() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+        else:
+            using_expr = sql.SQL("{column} AT TIME ZONE 'UTC'").format(column=column_id)
+            using_text = f"{column_name} AT TIME ZONE 'UTC'"
+
+        clauses.append(
+            sql.SQL("ALTER COLUMN {column} TYPE TIMESTAMPTZ USING {using}").format(
+                column=column_id, using=using_expr
+            )
+        )
+        clause_texts.append(f"ALTER COLUMN {column_name} TYPE TIMESTAMPTZ USING {using_text}")
+
+    alter_query = sql.SQL("ALTER TABLE {table} {clauses}").format(
+        table=sql.Identifier(table_name), clauses=sql.SQL(", ").join(clauses)
+    )
+    return alter_query, f"ALTER TABLE {table_name} {', '.join(clause_texts)}"
+
+
+def _alter_table(
+    database_url: str,
+    table_name: str,
+    columns: list[tuple[str, str]],
+    overwrite_nulls: bool,
+) -> None:
+    """Rewrite one table on its own connection, letting Postgres parallelize index rebuilds."""
+    alter_query, _ = _build_alter(table_name, columns, overwrite_nulls)
+    conn = psycopg2.connect(database_url)
+    try:
+        with conn, conn.cursor() as cursor:
+            cursor.execute(f"SET LOCAL max_parallel_maintenance_workers = {PARALLEL_MAINTENANCE_WORKERS}")
+            cursor.execute(f"SET LOCAL maintenance_work_mem = '{MAINTENANCE_WORK_MEM}'")
+            cursor.execute(alter_query)
+    except psycopg2.Error as e:
+        logger.error(f"  ❌ Failed to convert {_describe(table_name, columns)}: {e}")
+        raise
+    finally:
+        conn.close()
+
 
 def migrate_timestamps_to_timestamptz(
     database_url: str,
     schema: str = "public",
     dry_run: bool = False,
     overwrite_nulls: bool = False,
+    jobs: int = 1,
 ):
     """
     Migrate TIMESTAMP columns to TIMESTAMPTZ, interpreting existing values as UTC.
@@ -35,10 +121,15 @@ def migrate_timestamps_to_timestamptz(
         schema: Database schema to process (default: public)
         dry_run: If True, only print what would be done without making changes
         overwrite_nulls: If True, set NULL timestamp values to current UTC time
+        jobs: Number of tables to rewrite concurrently. With the default of 1 the
+              whole migration is one transaction; with more, each table commits
+              separately on its own connection.
     """
-    print(f"{'[DRY RUN] ' if dry_run else ''}Starting PostgreSQL timezone migration")
+    logger.info(f"{'[DRY RUN] ' if dry_run else ''}Starting PostgreSQL timezone migration")
 
     conn = psycopg2.connect(database_url)
+    # In serial mode all ALTERs run in the single transaction psycopg2 opens
+    # implicitly, and are committed together at the end, so the migration is atomic.
     conn.autocommit = False
 
     try:
@@ -56,61 +147,64 @@ def migrate_timestamps_to_timestamptz(
         timestamp_columns = cursor.fetchall()
 
         if not timestamp_columns:
-            print("✓ No TIMESTAMP columns found - all columns may already be TIMESTAMPTZ")
+            logger.info("✓ No TIMESTAMP columns found - all columns may already be TIMESTAMPTZ")
             return
 
-        print(f"Found {len(timestamp_columns)} TIMESTAMP columns to migrate:")
+        # Group columns by table: each table gets one ALTER TABLE (one rewrite),
+        # and no two workers ever contend for the same table
+        columns_by_table = {}
+        for table_name, column_name, is_nullable in timestamp_columns:
+            columns_by_table.setdefault(table_name, []).append((column_name, is_nullable))
+
+        logger.info(
+            f"Found {len(timestamp_columns)} TIMESTAMP columns to migrate "
+            f"in {len(columns_by_table)} tables"
+        )
         for table, column, nullable in timestamp_columns:
-            print(f"  - {table}.{column} (nullable: {nullable})")
+            logger.debug(f"  - {table}.{column} (nullable: {nullable})")
 
         if dry_run:
-            print("\n[DRY RUN] Would execute the following migrations:")
-
-        for table_name, column_name, is_nullable in timestamp_columns:
-            # Use sql.Identifier to safely quote identifiers
-            table_id = sql.Identifier(table_name)
-            column_id = sql.Identifier(column_name)
-
-            # Step 1: Optionally fill NULL values
-            if overwrite_nulls and is_nullable == 'YES':
-                fill_nulls_query = sql.SQL("""
-                    UPDATE {table} SET {column} = NOW() AT TIME ZONE 'UTC'
-                    WHERE {column} IS NULL
-                """).format(table=table_id, column=column_id)
-
-                if dry_run:
-                    print(f"  UPDATE {table_name} SET {column_name} = NOW() WHERE {column_name} IS NULL")
-                else:
-                    cursor.execute(fill_nulls_query)
-                    if cursor.rowcount > 0:
-                        print(f"  ✓ Filled {cursor.rowcount} NULL values in {table_name}.{column_name}")
-
-            # Step 2: Convert column to TIMESTAMPTZ
-            # First, we update the column type, treating existing values as UTC
-            alter_query = sql.SQL("""
-                ALTER TABLE {table}
-                ALTER COLUMN {column} TYPE TIMESTAMPTZ
-                USING {column} AT TIME ZONE 'UTC'
-            """).format(table=table_id, column=column_id)
-
-            if dry_run:
-                print(f"  ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE TIMESTAMPTZ USING {column_name} AT TIME ZONE 'UTC'")
-            else:
+            # The statements are the dry run's output, so they are emitted in one write
+            statements = [
+                _build_alter(table_name, columns, overwrite_nulls)[1]
+                for table_name, columns in columns_by_table.items()
+            ]
+            logger.info(
+                "[DRY RUN] Would execute the following migrations:\n"
+                + "\n".join(f"  {statement}" for statement in statements)
+            )
+        elif jobs > 1 and len(columns_by_table) > 1:
+            # Tables are independent, so rewrite them concurrently on separate
+            # connections. Each table commits on its own in this mode.
+            with ThreadPoolExecutor(max_workers=min(jobs, len(columns_by_table))) as executor:
+                futures = [
+                    executor.submit(_alter_table, database_url, table_name, columns, overwrite_nulls)
+                    for table_name, columns in columns_by_table.items()
+                ]
+                for future in _progress(as_completed(futures), total=len(futures)):
+                    future.result()
+        else:
+            cursor.execute(f"SET LOCAL max_parallel_maintenance_workers = {PARALLEL_MAINTENANCE_WORKERS}")
+            cursor.execute(f"SET LOCAL maintenance_work_mem = '{MAINTENANCE_WORK_MEM}'")
+            for table_name, columns in _progress(columns_by_table.items(), total=len(columns_by_table)):
+                alter_query, _ = _build_alter(table_name, columns, overwrite_nulls)
                 try:
                     cursor.execute(alter_query)
-                    print(f"  ✓ Converted {table_name}.{column_name} to TIMESTAMPTZ")
                 except psycopg2.Error as e:
-                    print(f"  ❌ Failed to convert {table_name}.{column_name}: {e}")
+                    logger.error(f"  ❌ Failed to convert {_describe(table_name, columns)}: {e}")
                     raise
 
         if not dry_run:
             conn.commit()
-            print("\n✅ PostgreSQL timezone migration completed successfully!")
+            logger.info(
+                f"✅ PostgreSQL timezone migration completed: converted "
+                f"{len(timestamp_columns)} columns in {len(columns_by_table)} tables to TIMESTAMPTZ"
+            )
         else:
-            print("\n[DRY RUN] No changes were made. Run without --dry-run to apply migrations.")
+            logger.info("[DRY RUN] No changes were made. Run without --dry-run to apply migrations.")
 
     except Exception as e:
-        print(f"❌ Migration failed: {e}")
+        logger.error(f"❌ Migration failed: {e}")
         conn.rollback()
         raise
     finally:
@@ -143,10 +237,24 @@ if __name__ == "__main__":
         action="store_true",
         help="Fill NULL timestamp values with current UTC time (default: leave NULLs unchanged)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Tables to rewrite concurrently; >1 commits each table separately (default: 1)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="List every column found before migrating",
+    )
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(message)s")
+
     if not args.database_url:
-        print("❌ Database URL required. Set DATABASE_URL env var or use --database-url")
+        logger.error("❌ Database URL required. Set DATABASE_URL env var or use --database-url")
         sys.exit(1)
 
     try:
@@ -155,7 +263,7 @@ if __name__ == "__main__":
             schema=args.schema,
             dry_run=args.dry_run,
             overwrite_nulls=args.fill_nulls,
+            jobs=args.jobs,
         )
-    except Exception as e:
-        print(f"❌ Migration failed: {e}")
+    except Exception:
         sys.exit(1)
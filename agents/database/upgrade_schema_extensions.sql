@@ -228,6 +228,25 @@ CREATE INDEX IF NOT EXISTS idx_ocr_frame_id ON ocr_text(frame_id);
 CREATE INDEX IF NOT EXISTS idx_ocr_text_fts ON ocr_text
 USING GIN (to_tsvector('english', coalesce(text, '')));
 
+-- Compress OCR text with LZ4 instead of pglz (PostgreSQL 14+, built --with-lz4).
+-- Screen text is highly repetitive and LZ4 is much cheaper to (de)compress.
+-- TOAST compression applies to values over ~2KB, and only to rows written
+-- after the change. The column stays TEXT, so the FTS index keeps working.
+DO $$
+BEGIN
+    IF current_setting('server_version_num')::int >= 140000 THEN
+        BEGIN
+            ALTER TABLE ocr_text ALTER COLUMN text SET COMPRESSION lz4;
+            RAISE NOTICE '✓ ocr_text.text uses LZ4 compression';
+        EXCEPTION WHEN feature_not_supported OR invalid_parameter_value THEN
+            RAISE NOTICE '✓ Skipped: LZ4 not available, ocr_text.text keeps pglz';
+        END;
+    ELSE
+        RAISE NOTICE '✓ Skipped: column compression needs PostgreSQL 14+';
+    END IF;
+END;
+$$;
+
 -- Window context table
 CREATE TABLE IF NOT EXISTS window_context (
     id BIGSERIAL PRIMARY KEY,
@@ -290,7 +309,28 @@ CREATE TABLE IF NOT EXISTS sessions (
 CREATE INDEX IF NOT EXISTS idx_sessions_times ON sessions(start_time, end_time);
 
 -- ===================================================================
--- STEP 6: Enable Compression (Optional)
+-- STEP 6: Notify Workers of New Frames
+-- ===================================================================
+
+-- The OCR worker and frame processor LISTEN on 'frames_pending' and only fall
+-- back to polling (every poll_interval seconds) as a safety net.
+CREATE OR REPLACE FUNCTION notify_frames_pending() RETURNS trigger AS $$
+BEGIN
+    IF NEW.vision_status = 0 THEN
+        PERFORM pg_notify('frames_pending', NEW.id::text);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS frames_pending_notify ON frames;
+CREATE TRIGGER frames_pending_notify
+    AFTER INSERT ON frames
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_frames_pending();
+
+-- ===================================================================
+-- STEP 7: Enable Compression (Optional)
 -- ===================================================================
 
 -- Enable compression on frames hypertable for data older than 48 hours
@@ -313,7 +353,7 @@ END;
 $$;
 
 -- ===================================================================
--- STEP 7: Verification
+-- STEP 8: Verification
 -- ===================================================================
 
 DO $$
@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run, unless the calling thread already runs an event loop
+    (where asyncio.run raises RuntimeError); the coroutine then runs on its own
+    loop in a worker thread while the caller blocks.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter for asyncio.
+
+    Holds up to `capacity` tokens, refilled continuously at `refill_rate` tokens
+    per second. Waiters are served in arrival order.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until `tokens` are available and take them."""
+        # A request larger than the bucket could never be served; cap it
+        tokens = min(tokens, self.capacity)
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._updated) * self.refill_rate
+                    )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.refill_rate)
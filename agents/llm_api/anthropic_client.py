@@ -25,7 +25,9 @@ from agents.errors import (
 )
 from agents.helpers.datetime_helpers import get_utc_time
 from agents.llm_api.helpers import (
+    INLINE_IMAGE_PREFIXES,
     add_inner_thoughts_to_functions,
+    split_data_uri,
     unpack_all_inner_thoughts_from_kwargs,
 )
 from agents.llm_api.llm_client_base import LLMClientBase
@@ -138,11 +140,8 @@ class AnthropicClient(LLMClientBase):
     ) -> Union[anthropic.AsyncAnthropic, anthropic.Anthropic]:
         override_key = ProviderManager().get_anthropic_override_key()
         if async_client:
-            return (
-                anthropic.AsyncAnthropic(api_key=override_key)
-                if override_key
-                else anthropic.AsyncAnthropic()
-            )
+            kwargs = {"api_key": override_key} if override_key else {}
+            return self._cached_async_client(anthropic.AsyncAnthropic, **kwargs)
         return (
             anthropic.Anthropic(api_key=override_key)
             if override_key
@@ -332,8 +331,36 @@ class AnthropicClient(LLMClientBase):
                         )
 
                     else:
-                        file = self.file_manager.get_file_metadata_by_id(m["image_id"])
-                        if file.source_url is not None:
+                        image_id = m["image_id"]
+                        # Data URIs and remote URLs are sent as-is, without a file lookup
+                        file = (
+                            None
+                            if image_id.startswith(INLINE_IMAGE_PREFIXES)
+                            else self.file_manager.get_file_metadata_by_id(image_id)
+                        )
+                        if file is None and image_id.startswith("data:"):
+                            mime_type, base64_data = split_data_uri(image_id)
+                            message_content.append(
+                                {
+                                    "type": "image",
+                                    "source": {
+                                        "type": "base64",
+                                        "media_type": mime_type,
+                                        "data": base64_data,
+                                    },
+                                }
+                            )
+                        elif file is None:
+                            message_content.append(
+                                {
+                                    "type": "image",
+                                    "source": {
+                                        "type": "url",
+                                        "url": image_id,
+                                    },
+                                }
+                            )
+                        elif file.source_url is not None:
                             message_content.append(
                                 {
                                     "type": "image",
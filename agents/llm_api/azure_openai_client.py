@@ -122,7 +122,7 @@ class AzureOpenAIClient(OpenAIClient):
         """
         Performs asynchronous request to Azure OpenAI API.
         """
-        client = AsyncAzureOpenAI(**self._prepare_client_kwargs())
+        client = self._cached_async_client(AsyncAzureOpenAI, **self._prepare_client_kwargs())
         response: ChatCompletion = await client.chat.completions.create(**request_data)
         return response.model_dump()
 
@@ -142,7 +142,7 @@ class AzureOpenAIClient(OpenAIClient):
         """
         Performs asynchronous streaming request to Azure OpenAI API.
         """
-        client = AsyncAzureOpenAI(**self._prepare_client_kwargs())
+        client = self._cached_async_client(AsyncAzureOpenAI, **self._prepare_client_kwargs())
         response_stream: AsyncStream[
             ChatCompletionChunk
         ] = await client.chat.completions.create(**request_data, stream=True)
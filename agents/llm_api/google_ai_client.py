@@ -12,7 +12,11 @@ from google.genai.types import (
 from agents.constants import NON_USER_MSG_PREFIX
 from agents.helpers.datetime_helpers import get_utc_time
 from agents.helpers.json_helpers import json_dumps
-from agents.llm_api.helpers import make_post_request
+from agents.llm_api.helpers import (
+    INLINE_IMAGE_PREFIXES,
+    make_post_request,
+    split_data_uri,
+)
 from agents.llm_api.llm_client_base import LLMClientBase
 from agents.log import get_logger
 from agents.schemas.llm_config import LLMConfig
@@ -36,6 +40,10 @@ from agents.utils import (
 
 logger = get_logger(__name__)
 
+# (connect, read) seconds for fetching a remote image to inline; the fetch runs
+# on the LLM request path, so a stalled image host must not hang the call
+IMAGE_FETCH_TIMEOUT = (5, 15)
+
 
 class GoogleAIClient(LLMClientBase):
     def request(self, request_data: dict) -> dict:
@@ -193,10 +201,42 @@ class GoogleAIClient(LLMClientBase):
                         )
                     else:
                         message_parts.append({"text": f"<image {global_image_idx}>"})
-                        file = self.file_manager.get_file_metadata_by_id(
-                            part["image_id"]
+                        image_id = part["image_id"]
+                        # Data URIs and remote URLs are used as-is, without a file lookup
+                        file = (
+                            None
+                            if image_id.startswith(INLINE_IMAGE_PREFIXES)
+                            else self.file_manager.get_file_metadata_by_id(image_id)
                         )
-                        if file.source_url is not None:
+                        if file is None and image_id.startswith("data:"):
+                            mime_type, base64_data = split_data_uri(image_id)
+                            message_parts.append(
+                                {
+                                    "inline_data": {
+                                        "mime_type": mime_type,
+                                        "data": base64_data,
+                                    }
+                                }
+                            )
+                        elif file is None:
+                            # Google AI takes inline bytes, so fetch the remote image
+                            import base64
+
+                            response = requests.get(image_id, timeout=IMAGE_FETCH_TIMEOUT)
+                            response.raise_for_status()
+                            mime_type = response.headers.get("content-type", "image/jpeg")
+                            base64_data = base64.b64encode(response.content).decode(
+                                "utf-8"
+                            )
+                            message_parts.append(
+                                {
+                                    "inline_data": {
+                                        "mime_type": mime_type,
+                                        "data": base64_data,
+                                    }
+                                }
+                            )
+                        elif file.source_url is not None:
                             # For Google AI, we need to convert URL to base64
                             import requests
 
@@ -2,7 +2,7 @@ import copy
 import json
 import warnings
 from collections import OrderedDict
-from typing import Any, List, Union
+from typing import Any, List, Tuple, Union
 
 import requests
 
@@ -13,6 +13,17 @@ from agents.schemas.openai.chat_completion_response import ChatCompletionRespons
 from agents.settings import summarizer_settings
 from agents.utils import count_tokens, json_dumps, printd
 
+# ImageContent.image_id values that are the image itself (an inline data URI or
+# a remote URL) rather than the id of a FileMetadata record
+INLINE_IMAGE_PREFIXES = ("data:", "http://", "https://")
+
+
+def split_data_uri(uri: str) -> Tuple[str, str]:
+    """Split a base64 `data:` URI into (mime_type, base64 payload)."""
+    header, _, data = uri.partition(",")
+    mime_type = header[len("data:"):].split(";", 1)[0] or "image/jpeg"
+    return mime_type, data
+
 
 def _convert_to_structured_output_helper(property: dict) -> dict:
     """Convert a single JSON schema property to structured output format (recursive)"""
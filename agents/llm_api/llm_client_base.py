@@ -1,5 +1,6 @@
+import asyncio
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 from agents.errors import LLMError
 from agents.schemas.llm_config import LLMConfig
@@ -26,6 +27,27 @@ class LLMClientBase:
         self.use_tool_naming = use_tool_naming
         self.file_manager = FileManager()
         self.cloud_file_mapping_manager = CloudFileMappingManager()
+        # SDK-level retries of the provider clients; None keeps the SDK default.
+        # Callers with their own retry policy (e.g. VisionWorker) set it to 0.
+        self.max_retries: Optional[int] = None
+        self._async_client: Optional[tuple] = None  # (event loop, kwargs, client)
+
+    def _cached_async_client(self, factory: Callable[..., Any], **kwargs) -> Any:
+        """
+        Return an async SDK client built by `factory(**kwargs)`.
+
+        The client is reused across requests on the same event loop, so they
+        share its httpx connection pool (keepalive, no TCP/TLS setup per call).
+        A new one is built when the loop or the kwargs (e.g. a rotated API key)
+        change; httpx connections cannot outlive the loop they were opened on.
+        """
+        if self.max_retries is not None:
+            kwargs["max_retries"] = self.max_retries
+        loop = asyncio.get_running_loop()
+        cached = self._async_client
+        if cached is None or cached[0] is not loop or cached[1] != kwargs:
+            cached = self._async_client = (loop, kwargs, factory(**kwargs))
+        return cached[2]
 
     def send_llm_request(
         self,
@@ -61,6 +83,37 @@ class LLMClientBase:
 
         return chat_completion_data
 
+    async def send_llm_request_async(
+        self,
+        messages: List[Message],
+        tools: Optional[List[dict]] = None,
+        force_tool_call: Optional[str] = None,
+        existing_file_uris: Optional[List[str]] = None,
+    ) -> ChatCompletionResponse:
+        """
+        Issues a request to the downstream model endpoint without blocking the event loop.
+        Request building (which may read images from disk) runs in a worker thread.
+        """
+        request_data = await asyncio.to_thread(
+            self.build_request_data,
+            messages,
+            self.llm_config,
+            tools,
+            force_tool_call,
+            existing_file_uris=existing_file_uris,
+        )
+
+        try:
+            response_data = await self.request_async(request_data)
+        except Exception as e:
+            raise self.handle_llm_error(e)
+
+        chat_completion_data = self.convert_response_to_chat_completion(
+            response_data, messages
+        )
+
+        return chat_completion_data
+
     @abstractmethod
     def build_request_data(
         self,
@@ -82,6 +135,13 @@ class LLMClientBase:
         """
         raise NotImplementedError
 
+    async def request_async(self, request_data: dict) -> dict:
+        """
+        Performs underlying asynchronous request to llm and returns raw response.
+        Clients without a native async SDK path run `request` in a worker thread.
+        """
+        return await asyncio.to_thread(self.request, request_data)
+
     @abstractmethod
     def convert_response_to_chat_completion(
         self,
@@ -24,6 +24,7 @@ from agents.errors import (
     LLMUnprocessableEntityError,
 )
 from agents.llm_api.helpers import (
+    INLINE_IMAGE_PREFIXES,
     add_inner_thoughts_to_functions,
     convert_to_structured_output,
     unpack_all_inner_thoughts_from_kwargs,
@@ -241,8 +242,24 @@ class OpenAIClient(LLMClientBase):
                                 "text": f"<image {global_image_idx}>",
                             }
                         )
-                        file = self.file_manager.get_file_metadata_by_id(m["image_id"])
-                        if file.source_url is not None:
+                        image_id = m["image_id"]
+                        # Data URIs and remote URLs are sent as-is, without a file lookup
+                        file = (
+                            None
+                            if image_id.startswith(INLINE_IMAGE_PREFIXES)
+                            else self.file_manager.get_file_metadata_by_id(image_id)
+                        )
+                        if file is None:
+                            message_content.append(
+                                {
+                                    "type": "image_url",
+                                    "image_url": {
+                                        "url": image_id,
+                                        "detail": m["detail"],
+                                    },
+                                }
+                            )
+                        elif file.source_url is not None:
                             message_content.append(
                                 {
                                     "type": "image_url",
@@ -326,7 +343,7 @@ class OpenAIClient(LLMClientBase):
         """
         Performs underlying asynchronous request to OpenAI API and returns raw response dict.
         """
-        client = AsyncOpenAI(**self._prepare_client_kwargs())
+        client = self._cached_async_client(AsyncOpenAI, **self._prepare_client_kwargs())
         response: ChatCompletion = await client.chat.completions.create(**request_data)
         return response.model_dump()
 
@@ -370,7 +387,7 @@ class OpenAIClient(LLMClientBase):
         """
         Performs underlying asynchronous streaming request to OpenAI and returns the async stream iterator.
         """
-        client = AsyncOpenAI(**self._prepare_client_kwargs())
+        client = self._cached_async_client(AsyncOpenAI, **self._prepare_client_kwargs())
         response_stream: AsyncStream[
             ChatCompletionChunk
         ] = await client.chat.completions.create(**request_data, stream=True)
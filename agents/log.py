@@ -1,12 +1,19 @@
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from agents.settings import settings
 
 selected_log_level = logging.DEBUG if settings.debug else logging.INFO
 
+# Each logger is configured once; getLogger takes the logging module lock on every call
+_loggers: Dict[str, logging.Logger] = {}
+
 
 def get_logger(name: Optional[str] = None) -> "logging.Logger":
-    logger = logging.getLogger("Mirix")
-    logger.setLevel(logging.INFO)
+    name = name or "Mirix"
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = logging.getLogger(name)
+        logger.setLevel(selected_log_level)
+        logger = _loggers.setdefault(name, logger)
     return logger
@@ -1,4 +1,5 @@
 from agents.processors.ocr_worker import (
+    ERR_IMAGE_LOAD,
     VISION_STATUS_DONE,
     VISION_STATUS_ERROR,
     VISION_STATUS_PENDING,
@@ -7,6 +8,7 @@ from agents.processors.ocr_worker import (
     OCRWorker,
 )
 from agents.processors.vision_worker import (
+    ERR_NO_SUMMARY,
     VISION_STATUS_OCR_DONE,
     VISION_STATUS_VISION_DONE,
     VISION_STATUS_VISION_PROCESSING,
@@ -29,4 +31,7 @@ __all__ = [
     "VISION_STATUS_OCR_DONE",
     "VISION_STATUS_VISION_PROCESSING",
     "VISION_STATUS_VISION_DONE",
+    # Error messages
+    "ERR_IMAGE_LOAD",
+    "ERR_NO_SUMMARY",
 ]
@@ -1,28 +1,82 @@
 import logging
-import time
-from typing import List
-from uuid import UUID, uuid4
+from typing import List, Optional
 from datetime import timedelta
 
 from sqlalchemy import text
 from agents.database.connection import get_db
+from agents.helpers.async_helpers import run_sync
 from agents.schemas.frame import Frame
-from agents.settings import settings
 
 logger = logging.getLogger(__name__)
 
 class SessionConsolidator:
-    def __init__(self, gap_threshold_secs: int = 300):
+    def __init__(self, gap_threshold_secs: int = 300, limit: int = 500):
         self.gap_threshold = timedelta(seconds=gap_threshold_secs)
+        self.limit = limit
+        self._summarizer = None
 
-    def consolidate_sessions(self):
+    def get_recent_frames(self) -> List[Frame]:
+        """Fetch the most recent frames in capture order."""
+        db = next(get_db())
+        frames = []
+        try:
+            query = text("""
+                SELECT * FROM (
+                    SELECT * FROM frames
+                    ORDER BY captured_at DESC
+                    LIMIT :limit
+                ) recent
+                ORDER BY captured_at ASC
+            """)
+            result = db.execute(query, {"limit": self.limit})
+            frames = [Frame(**row._mapping) for row in result.fetchall()]
+        except Exception as e:
+            logger.error(f"Error fetching recent frames: {e}")
+            db.rollback()
+        finally:
+            db.close()
+        return frames
+
+    def split_sessions(self, frames: List[Frame]) -> List[List[Frame]]:
+        """Split time-ordered frames into sessions wherever the gap exceeds the threshold."""
+        sessions: List[List[Frame]] = []
+        for frame in frames:
+            if sessions and frame.captured_at - sessions[-1][-1].captured_at <= self.gap_threshold:
+                sessions[-1].append(frame)
+            else:
+                sessions.append([frame])
+        return sessions
+
+    def consolidate_sessions(self, frames: Optional[List[Frame]] = None):
         """
-        Look for frames that have vision_summary but are not assigned to a session (or just group them).
-        In this simple version, we just look at recent frames and print a session boundary.
-        Real implementation would need a 'session_id' in frames or a separate sessions table.
+        Group recent frames into sessions and summarize each session hierarchically.
+        Real implementation would need a 'session_id' in frames or a separate sessions table
+        to persist the results; for now the summaries are logged and returned.
         """
-        # Placeholder logic
-        pass
+        if frames is None:
+            frames = self.get_recent_frames()
+        if not frames:
+            return []
+
+        # Lazy load the summarizer to avoid LLM client setup when there is nothing to do
+        if self._summarizer is None:
+            from agents.agent.vision import HierarchicalFrameSummarizer
+            self._summarizer = HierarchicalFrameSummarizer()
+
+        return run_sync(self._summarize_sessions(self.split_sessions(frames)))
+
+    async def _summarize_sessions(self, sessions: List[List[Frame]]):
+        # Sessions run one after another; each one fans out up to the vision
+        # agent's concurrency limit internally.
+        results = []
+        for session in sessions:
+            summary = await self._summarizer.asummarize(session)
+            logger.info(
+                f"Session {session[0].captured_at} - {session[-1].captured_at} "
+                f"({len(session)} frames): {summary.session_summary}"
+            )
+            results.append(summary)
+        return results
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -1,160 +1,216 @@
+import asyncio
 import logging
 import time
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import text, select, update
-from agents.database.connection import get_db
-from agents.schemas.frame import Frame
-from agents.settings import settings
+import asyncpg
+
+try:
+    import uvloop
+except ImportError:  # optional; the stdlib event loop is used instead
+    uvloop = None
+
+from agents.database.connection import get_db_connection, get_libpq_dsn
 
 logger = logging.getLogger(__name__)
 
+# Channel the frames insert trigger notifies on (upgrade_schema_extensions.sql)
+FRAMES_PENDING_CHANNEL = "frames_pending"
+
+# Vision status values as used by this processor
+VISION_STATUS_PENDING = 0
+VISION_STATUS_DONE = 1
+VISION_STATUS_FAILED = 2
+
+
+@dataclass(slots=True, frozen=True)
+class FrameRow:
+    """
+    The frame columns vision processing reads, built straight from a DB row.
+
+    Rows come from the frames schema already typed by the driver, so this skips
+    the per-field validation of the Frame Pydantic model on the polling path.
+    """
+
+    id: UUID
+    captured_at: datetime
+    image_ref: Optional[str]
+    app_name: Optional[str]
+    window_title: Optional[str]
+    ocr_text: Optional[str]
+    phash64: Optional[int]
+    vision_status: int
+
+
 class FrameProcessor:
     def __init__(self, batch_size: int = 10, poll_interval: int = 5):
         self.batch_size = batch_size
         self.poll_interval = poll_interval
         self.running = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._listen_conn: Optional[asyncpg.Connection] = None
+        self.vision_agent = None
 
-    def get_pending_vision_frames(self) -> List[Frame]:
+    def _on_frames_pending(self, connection, pid, channel, payload):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _ensure_listener(self):
         """
-        Fetch frames that need vision processing.
-        Uses SKIP LOCKED to allow multiple processors (if we ever scale).
+        Open a dedicated connection that LISTENs for new frames.
+        On failure the loop keeps polling and the next idle cycle retries.
         """
-        db = next(get_db())
-        frames = []
+        if self._listen_conn is not None and not self._listen_conn.is_closed():
+            return
         try:
-            # We select frames where vision_status = 0 (Pending)
-            # And lock them to prevent other workers from picking them up
-            # Note: This lock lasts until the transaction is committed/rolled back
-            # But here we are just reading.
-            # For true robust processing, we should mark them as 'processing' or hold the transaction.
-            # Since we are doing a simple poll, we will fetch them and immediately update status to 'processing' (e.g. 99)
-            # Or we just process them one by one.
-            
-            # Let's use a simple SELECT for now, assuming single worker.
-            # If we wanted concurrent, we'd need:
-            # SELECT * FROM frames WHERE vision_status = 0 LIMIT N FOR UPDATE SKIP LOCKED
-            
-            query = text("""
-                SELECT * FROM frames 
-                WHERE vision_status = 0 
-                ORDER BY captured_at ASC 
-                LIMIT :limit
-            """)
-            
-            result = db.execute(query, {"limit": self.batch_size})
-            rows = result.fetchall()
-            
-            # Convert to Pydantic models
-            for row in rows:
-                # Row is a tuple/named tuple. We need to map it.
-                # Sqlalchemy returns a Row object which behaves like a dict or tuple
-                frame_dict = row._mapping
-                frames.append(Frame(**frame_dict))
-                
-        except Exception as e:
-            logger.error(f"Error fetching pending frames: {e}")
-            # Assuming db session might need rollback if error
-            db.rollback()
-        finally:
-            db.close()
-            
-        return frames
-
-    def mark_frame_processing(self, frame_ids: List[UUID]):
-        # Optional: mark as 'processing' if we have that state
-        pass
+            self._listen_conn = await asyncpg.connect(get_libpq_dsn())
+            await self._listen_conn.add_listener(FRAMES_PENDING_CHANNEL, self._on_frames_pending)
+            logger.info(f"Listening for new frames on '{FRAMES_PENDING_CHANNEL}'")
+        except (OSError, asyncpg.PostgresError) as e:
+            logger.warning(f"LISTEN unavailable, falling back to polling: {e}")
+            self._listen_conn = None
 
-    def update_vision_summary(self, frame_id: UUID, summary: str):
-        db = next(get_db())
+    async def wait_for_frames(self, deadline: Optional[float] = None):
+        """
+        Wait until a new frame is notified or the next poll is due.
+        `deadline` is a time.monotonic() value, normally the start of the last
+        poll plus poll_interval, so query time does not stretch the period.
+        """
+        if deadline is None:
+            deadline = time.monotonic() + self.poll_interval
+        await self._ensure_listener()
         try:
-            query = text("""
-                UPDATE frames 
-                SET vision_summary = :summary, vision_status = 1 
-                WHERE id = :id
-            """)
-            db.execute(query, {"summary": summary, "id": frame_id})
-            db.commit()
-            logger.info(f"Updated summary for frame {frame_id}")
-        except Exception as e:
-            logger.error(f"Error updating frame {frame_id}: {e}")
-            db.rollback()
-        finally:
-            db.close()
+            await asyncio.wait_for(
+                self._wakeup.wait(), timeout=max(0.0, deadline - time.monotonic())
+            )
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def get_pending_vision_frames(self, conn: asyncpg.Connection) -> List[FrameRow]:
+        """
+        Fetch frames that need vision processing.
+        Assumes a single processor; concurrent ones would need a
+        FOR UPDATE SKIP LOCKED claim like the OCR worker's.
+        """
+        # Only the columns FrameRow needs; SELECT * would also ship the
+        # 384-dim embedding vector of every row
+        rows = await conn.fetch(
+            """
+            SELECT id, captured_at, image_ref, app_name, window_title,
+                   ocr_text, phash AS phash64, vision_status
+            FROM frames
+            WHERE vision_status = $1
+            ORDER BY captured_at ASC
+            LIMIT $2
+            """,
+            VISION_STATUS_PENDING,
+            self.batch_size,
+        )
+        return [FrameRow(*row) for row in rows]
 
-    def run_loop(self):
+    async def update_vision_results(
+        self, conn: asyncpg.Connection, results: List[Tuple[UUID, Optional[str]]]
+    ):
+        """
+        Store a batch of (frame_id, summary) results in one UPDATE.
+        The batch travels as parallel arrays joined with unnest, so the whole
+        write is a single statement however many frames it covers. Frames
+        without a summary are marked failed and keep their old summary.
+        """
+        ids = [frame_id for frame_id, _ in results]
+        summaries = [summary for _, summary in results]
+        statuses = [VISION_STATUS_DONE if summary else VISION_STATUS_FAILED for summary in summaries]
+        await conn.execute(
+            """
+            UPDATE frames
+            SET vision_summary = COALESCE(data.summary, frames.vision_summary),
+                vision_status = data.status
+            FROM unnest($1::uuid[], $2::text[], $3::int[]) AS data(id, summary, status)
+            WHERE frames.id = data.id
+            """,
+            ids,
+            summaries,
+            statuses,
+        )
+        done = sum(1 for summary in summaries if summary)
+        logger.info(f"Updated {len(ids)} frames ({done} summarized, {len(ids) - done} failed)")
+
+    async def run_loop(self):
         """
         Main polling loop.
         """
         self.running = True
         logger.info("Starting Frame Processor Loop...")
-        
-        while self.running:
-            try:
-                frames = self.get_pending_vision_frames()
-                
-                if not frames:
-                    time.sleep(self.poll_interval)
-                    continue
-                
-                logger.info(f"Found {len(frames)} pending frames.")
-                
-                # Process frames
-                # In a real implementation, this would call the Agent/LLM
-                # For now, we'll just log
-                for frame in frames:
-                    self.process_frame(frame)
-                    
-            except KeyboardInterrupt:
-                logger.info("Stopping Frame Processor...")
-                self.running = False
-            except Exception as e:
-                logger.error(f"Error in processor loop: {e}")
-                time.sleep(self.poll_interval)
-
-    def process_frame(self, frame: Frame):
+        self._wakeup = asyncio.Event()
+        await self._ensure_listener()
+
+        try:
+            while self.running:
+                try:
+                    # The fallback poll is scheduled from when this one started
+                    next_poll = time.monotonic() + self.poll_interval
+                    async with get_db_connection() as conn:
+                        frames = await self.get_pending_vision_frames(conn)
+
+                    if not frames:
+                        await self.wait_for_frames(next_poll)
+                        continue
+
+                    logger.info(f"Found {len(frames)} pending frames.")
+
+                    # LLM calls run concurrently; no connection is held meanwhile
+                    results = await self.process_frames(frames)
+
+                    async with get_db_connection() as conn:
+                        await self.update_vision_results(conn, results)
+
+                except asyncio.CancelledError:
+                    logger.info("Stopping Frame Processor...")
+                    self.running = False
+                except Exception as e:
+                    logger.error(f"Error in processor loop: {e}")
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            if self._listen_conn is not None:
+                await self._listen_conn.close()
+                self._listen_conn = None
+
+    async def process_frames(self, frames: List[FrameRow]) -> List[Tuple[UUID, Optional[str]]]:
         """
-        Process a single frame using the Vision Agent.
+        Summarize frames using the Vision Agent, returning (frame_id, summary) pairs.
+        The summary is None for frames that failed.
         """
         try:
-            logger.info(f"Processing frame: {frame.id} - {frame.app_name}")
-            
             # Lazy load agent to avoid init issues at startup if config is wrong
-            if not hasattr(self, 'vision_agent'):
+            if self.vision_agent is None:
                 from agents.agent.vision import VisionAgent
                 self.vision_agent = VisionAgent()
-            
-            summary = self.vision_agent.summarize_frame(frame)
-            
+
+            summaries = await self.vision_agent.asummarize_frames(frames)
+        except Exception as e:
+            logger.error(f"Error processing {len(frames)} frames: {e}")
+            summaries = [None] * len(frames)
+
+        for frame, summary in zip(frames, summaries, strict=True):
             if summary:
-                logger.info(f"Generated summary: {summary[:50]}...")
-                self.update_vision_summary(frame.id, summary)
+                logger.info(f"Generated summary for frame {frame.id} ({frame.app_name}): {summary[:50]}...")
             else:
                 logger.warning(f"No summary generated for frame {frame.id}")
-                # Mark as failed or skipped? For now, just leave as processed but empty?
-                # Or status = 2 (Failed)
-                self.update_vision_status(frame.id, 2) 
-                
-        except Exception as e:
-            logger.error(f"Error processing frame {frame.id}: {e}")
-            self.update_vision_status(frame.id, 2)
-
-    def update_vision_status(self, frame_id: UUID, status: int):
-        db = next(get_db())
-        try:
-            query = text("UPDATE frames SET vision_status = :status WHERE id = :id")
-            db.execute(query, {"status": status, "id": frame_id})
-            db.commit()
-        except Exception as e:
-            logger.error(f"Error updating status for frame {frame_id}: {e}")
-            db.rollback()
-        finally:
-            db.close()
+        return [(frame.id, summary) for frame, summary in zip(frames, summaries, strict=True)]
 
 if __name__ == "__main__":
     # Configure logging
     logging.basicConfig(level=logging.INFO)
-    
+
     processor = FrameProcessor()
-    processor.run_loop()
+    try:
+        if uvloop is not None:
+            uvloop.run(processor.run_loop())
+        else:
+            asyncio.run(processor.run_loop())
+    except KeyboardInterrupt:
+        pass
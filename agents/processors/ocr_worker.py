@@ -1,9 +1,14 @@
 """
 OCR Worker for Recall Pipeline.
 
-Polls for unprocessed frames and runs Tesseract OCR to extract text.
+Waits for unprocessed frames and runs Tesseract OCR to extract text.
 Updates the database with OCR results and status.
 
+New frames are signalled over LISTEN/NOTIFY on the 'frames_pending' channel
+(see the trigger in upgrade_schema_extensions.sql); polling remains as a fallback when
+no notification arrives, backing off from poll_interval_min towards
+poll_interval_max while the queue stays empty.
+
 Vision status values:
     0 = pending (unprocessed)
     1 = processing (currently being worked on)
@@ -13,24 +18,170 @@ Vision status values:
 
 import asyncio
 import logging
+import multiprocessing
+import os
+import random
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from itertools import pairwise
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, TypeVar
 from uuid import UUID
 
 import asyncpg
+import numpy as np
 from PIL import Image
-
-from agents.database.connection import get_db_connection
+from sqlalchemy import exc as sa_exc
+
+try:
+    import tesserocr
+except ImportError:  # optional; OCR then runs one tesseract subprocess per frame
+    tesserocr = None
+
+try:
+    import uvloop
+except ImportError:  # optional; the stdlib event loop is used instead
+    uvloop = None
+
+from agents.database.connection import (
+    bulk_copy_records,
+    get_db_connection,
+    get_libpq_dsn,
+    warm_async_pool,
+)
+from agents.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Frames come from our own capture service; multi-monitor captures can exceed
+# Pillow's decompression-bomb guard, which is meant for untrusted input
+Image.MAX_IMAGE_PIXELS = None
+
 # Vision status constants
 VISION_STATUS_PENDING = 0
 VISION_STATUS_PROCESSING = 1
 VISION_STATUS_DONE = 2
 VISION_STATUS_ERROR = -1
 
+# Prefix of OCRResult.error for frames whose image could not be read; the
+# image_ref follows after ": "
+ERR_IMAGE_LOAD = "Could not load image"
+
+# Channel the frames insert trigger notifies on
+FRAMES_PENDING_CHANNEL = "frames_pending"
+
+# Transient errors: conflicts are retried at once, connection failures with backoff.
+# get_db_connection checks connections out of the SQLAlchemy async engine, so
+# connect, pre-ping and pool-timeout failures arrive wrapped in SQLAlchemy's
+# exception classes rather than as raw asyncpg errors.
+RETRY_IMMEDIATELY_ERRORS = (asyncpg.SerializationError, asyncpg.DeadlockDetectedError)
+RETRY_WITH_BACKOFF_ERRORS = (
+    asyncpg.ConnectionDoesNotExistError,
+    asyncpg.PostgresConnectionError,
+    OSError,
+    asyncio.TimeoutError,
+    sa_exc.OperationalError,
+    sa_exc.InterfaceError,
+    sa_exc.DisconnectionError,
+    sa_exc.TimeoutError,
+)
+
+T = TypeVar("T")
+
+# Longest a finished OCR result waits for others to share its write transaction
+WRITE_LINGER = 0.05
+
+# Text-region detection: the OCR input is reduced by ROI_DOWNSAMPLE and split
+# into ROI_TILE-pixel tiles, i.e. 32px squares of the image Tesseract sees
+ROI_DOWNSAMPLE = 4
+ROI_TILE = 8
+
+# Hot-path statements, prepared once per connection (see OCRWorker._prepared)
+CLAIM_FRAMES_SQL = """
+    WITH claimed AS (
+        SELECT id, captured_at
+        FROM frames
+        WHERE vision_status = $1
+        ORDER BY captured_at ASC
+        LIMIT $2
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE frames f
+    SET vision_status = $3
+    FROM claimed
+    WHERE f.id = claimed.id AND f.captured_at = claimed.captured_at
+    RETURNING f.id, f.captured_at, f.image_ref, f.vision_status, f.phash AS phash64
+"""
+
+MARK_FRAMES_ERROR_SQL = """
+    UPDATE frames
+    SET vision_status = $1
+    WHERE id = ANY($2::uuid[])
+"""
+
+UPDATE_FRAME_TEXT_SQL = """
+    UPDATE frames
+    SET ocr_text = $1, has_text = $2, vision_status = $3
+    WHERE id = $4
+"""
+
+
+# TessBaseAPI of an OCR pool process, created once by _init_tesserocr so the
+# language model is loaded per process rather than per frame
+_tess_api = None
+
+
+def _init_tesserocr(lang: str, config: str) -> None:
+    """OCR pool initializer: build this process's TessBaseAPI from the CLI-style config."""
+    global _tess_api
+    kwargs: dict[str, int] = {}
+    variables: dict[str, str] = {}
+    args = shlex.split(config)
+    for flag, value in pairwise(args):
+        if flag in ("--psm", "--oem"):
+            kwargs[flag[2:]] = int(value)
+        elif flag == "-c" and "=" in value:
+            name, _, setting = value.partition("=")
+            variables[name] = setting
+    _tess_api = tesserocr.PyTessBaseAPI(lang=lang, **kwargs)
+    for name, setting in variables.items():
+        _tess_api.SetVariable(name, setting)
+
+
+def _tesserocr_probe() -> bool:
+    """OCR pool task run once at startup; fails if _init_tesserocr could not load."""
+    return _tess_api is not None
+
+
+def _tesserocr_run(
+    image: str | tuple[str, tuple[int, int], bytes], collect_confidence: bool
+) -> tuple[str, float | None]:
+    """
+    OCR pool task: recognize a file path or raw (mode, size, pixels) image.
+    Raw pixels cross the process boundary instead of a pickled PIL image.
+    """
+    if isinstance(image, str):
+        _tess_api.SetImageFile(image)
+    else:
+        _tess_api.SetImage(Image.frombytes(*image))
+    text = _tess_api.GetUTF8Text().strip()
+    return text, float(_tess_api.MeanTextConf()) if collect_confidence else None
+
+
+def _local_path(image_ref: str) -> str:
+    """Strip a file:// scheme from an image reference."""
+    # Handle file:// URIs
+    if image_ref.startswith("file://"):
+        return image_ref[7:]
+    return image_ref
+
 
 @dataclass
 class OCRResult:
@@ -51,14 +202,49 @@ class FrameRecord:
     captured_at: Any  # datetime
     image_ref: str
     vision_status: int = 0
+    phash64: int | None = None
+
+
+class RecentTextCache:
+    """
+    LRU of recent OCR results keyed by the frames' 64-bit perceptual hash.
+
+    Consecutive captures of an unchanged window hash within a few bits of each
+    other, so their text can be copied instead of running Tesseract again.
+    Shared by the OCR threads, hence the lock.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: OrderedDict[int, tuple[str, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, phash64: int, max_distance: int) -> tuple[str, float | None] | None:
+        """Return (text, confidence) of the most recent entry within `max_distance` bits."""
+        with self._lock:
+            for recent in reversed(self._entries):
+                # Mask to 64 bits: phash64 is stored as a signed BIGINT
+                if bin((recent ^ phash64) & 0xFFFFFFFFFFFFFFFF).count("1") <= max_distance:
+                    self._entries.move_to_end(recent)
+                    return self._entries[recent]
+        return None
+
+    def put(self, phash64: int, text: str, confidence: float | None) -> None:
+        with self._lock:
+            self._entries[phash64] = (text, confidence)
+            self._entries.move_to_end(phash64)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
 
 
 class OCRWorker:
     """
     Long-running worker that polls for unprocessed frames and runs OCR.
 
-    Uses Tesseract via pytesseract for text extraction. Designed to work
-    with the recall-pipeline frames table in PostgreSQL.
+    Uses Tesseract for text extraction: through a pool of tesserocr processes
+    when the optional package is installed, otherwise the tesseract binary via
+    pytesseract. Designed to work with the recall-pipeline frames table in
+    PostgreSQL.
 
     Example:
         worker = OCRWorker(batch_size=10, poll_interval=5.0)
@@ -74,37 +260,136 @@ class OCRWorker:
         tesseract_lang: str = "eng",
         tesseract_config: str = "",
         min_text_length: int = 1,
+        ocr_concurrency: int | None = None,
+        max_width: int | None = 1600,
+        collect_confidence: bool = False,
+        poll_interval_min: float = 0.25,
+        poll_interval_max: float = 30.0,
+        poll_backoff: float = 1.5,
+        ocr_batch_size: int = 8,
+        dedupe_max_distance: int | None = 3,
+        dedupe_cache_size: int = 1024,
+        roi_variance_threshold: float | None = 50.0,
+        ocr_processes: int | None = None,
     ):
         """
         Initialize the OCR worker.
 
         Args:
             batch_size: Number of frames to process per batch.
-            poll_interval: Seconds to wait between polling cycles.
+            poll_interval: Initial seconds to wait between polling cycles
+                (0 polls again immediately, e.g. in tests).
             max_retries: Maximum retry attempts for database errors.
             retry_delay: Base delay between retries (exponential backoff).
             tesseract_lang: Language for Tesseract OCR (e.g., 'eng', 'eng+spa').
-            tesseract_config: Additional Tesseract configuration string.
+            tesseract_config: Additional Tesseract configuration string, e.g.
+                "--oem 1 --psm 6" to skip page layout analysis when captures are
+                a single uniform block of text.
             min_text_length: Minimum text length to consider as having text.
+            ocr_concurrency: Frames OCR'd in parallel threads per batch
+                (default: CPU count).
+            max_width: Images wider than this are downscaled (keeping aspect
+                ratio) before OCR; None disables downscaling.
+            collect_confidence: Run Tesseract in per-word mode to record an
+                average confidence in ocr_text. Off by default, since only
+                the text is used downstream.
+            poll_interval_min: Polling interval right after frames were
+                processed, when more are likely to follow.
+            poll_interval_max: Cap for the polling interval on an idle queue.
+            poll_backoff: Factor the interval grows by after each empty poll.
+            ocr_batch_size: Frames passed to one Tesseract process as a list of
+                files. Only applies when no preprocessing or confidence is
+                needed (max_width=None, collect_confidence=False); 1 disables.
+            dedupe_max_distance: Frames whose stored phash is within this many
+                bits of a recently OCR'd frame reuse its text without running
+                Tesseract; None disables.
+            dedupe_cache_size: Number of recent hashes kept for deduplication.
+            roi_variance_threshold: Tiles whose grayscale variance exceeds this
+                count as possible text; the image is cropped to their bounding
+                box before OCR, and skipped when there are none. None disables.
+                Only applies when images are preprocessed (max_width set).
+            ocr_processes: Size of the tesserocr process pool that keeps one
+                loaded Tesseract engine per process (default: CPU count - 1,
+                leaving a core for the event loop). Needs the optional
+                tesserocr package; 0 or a missing package falls back to the
+                tesseract binary via pytesseract.
         """
         self.batch_size = batch_size
         self.poll_interval = poll_interval
+        self.poll_interval_min = poll_interval_min
+        self.poll_interval_max = max(poll_interval_max, poll_interval_min)
+        self.poll_backoff = poll_backoff
+        self._cur_interval = poll_interval
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.tesseract_lang = tesseract_lang
         self.tesseract_config = tesseract_config
         self.min_text_length = min_text_length
+        self.ocr_concurrency = max(1, ocr_concurrency or os.cpu_count() or 4)
+        self.max_width = max_width
+        self.collect_confidence = collect_confidence
+        self.ocr_batch_size = max(1, ocr_batch_size)
+        self.dedupe_max_distance = dedupe_max_distance
+        self._recent_text = RecentTextCache(dedupe_cache_size)
+        self.roi_variance_threshold = roi_variance_threshold
         self.running = False
         self._tesseract_available: bool | None = None
+        # Bound by _check_tesseract once Tesseract is known to work
+        self._pytesseract: Any = None
+        self.ocr_processes = max(1, (os.cpu_count() or 2) - 1) if ocr_processes is None else ocr_processes
+        self._ocr_pool: ProcessPoolExecutor | None = None
+        # OCR threads reach _check_tesseract lazily; the lock keeps concurrent
+        # first calls from each starting a pool
+        self._tesseract_lock = threading.Lock()
+        self._wakeup: asyncio.Event | None = None
+        self._listen_conn: asyncpg.Connection | None = None
+        # Prepared statements are connection-scoped, so they are kept per
+        # pooled connection; entries for closed connections are dropped
+        self._stmts: dict[
+            asyncpg.Connection, dict[str, asyncpg.prepared_stmt.PreparedStatement]
+        ] = {}
 
     def _check_tesseract(self) -> bool:
-        """Check if Tesseract is available and cache the result."""
+        """
+        Check if Tesseract is available and cache the result.
+
+        The first call may block for up to a minute while the tesserocr pool
+        starts, so call it off the event loop (run() uses asyncio.to_thread).
+        """
+        if self._tesseract_available is not None:
+            return self._tesseract_available
+        with self._tesseract_lock:
+            return self._check_tesseract_locked()
+
+    def _check_tesseract_locked(self) -> bool:
+        """_check_tesseract's body, run under _tesseract_lock."""
+        if self._tesseract_available is None and tesserocr is not None and self.ocr_processes > 0:
+            try:
+                version = tesserocr.tesseract_version().splitlines()[0]
+                # spawn: forking a process running the event loop and pool threads is unsafe
+                self._ocr_pool = ProcessPoolExecutor(
+                    max_workers=self.ocr_processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_tesserocr,
+                    initargs=(self.tesseract_lang, self.tesseract_config),
+                )
+                # Run one task so a child that cannot load tesseract_lang (or the
+                # config) breaks the pool now rather than on every frame
+                self._ocr_pool.submit(_tesserocr_probe).result(timeout=60)
+                self._tesseract_available = True
+                logger.info(f"Tesseract OCR is available ({version}, {self.ocr_processes} processes)")
+            except Exception as e:
+                logger.warning(f"tesserocr unusable, falling back to pytesseract: {e}")
+                if self._ocr_pool is not None:
+                    self._ocr_pool.shutdown(cancel_futures=True)
+                    self._ocr_pool = None
         if self._tesseract_available is None:
             try:
                 import pytesseract
 
                 # Try to get Tesseract version to verify it's installed
                 pytesseract.get_tesseract_version()
+                self._pytesseract = pytesseract
                 self._tesseract_available = True
                 logger.info("Tesseract OCR is available")
             except Exception as e:
@@ -112,11 +397,81 @@ class OCRWorker:
                 logger.warning(f"Tesseract OCR not available: {e}")
         return self._tesseract_available
 
+    def _on_frames_pending(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        """asyncpg notification callback: wake the idle loop."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _ensure_listener(self) -> None:
+        """
+        Open the dedicated LISTEN connection if it is not already open.
+
+        LISTEN is session state, so it uses its own connection outside the pool
+        (and must not go through a transaction-pooling proxy). Failures are logged
+        and the worker keeps polling; the next idle cycle retries.
+        """
+        if self._listen_conn is not None and not self._listen_conn.is_closed():
+            return
+        try:
+            self._listen_conn = await asyncpg.connect(get_libpq_dsn())
+            await self._listen_conn.add_listener(FRAMES_PENDING_CHANNEL, self._on_frames_pending)
+            logger.info(f"Listening for new frames on '{FRAMES_PENDING_CHANNEL}'")
+        except (OSError, asyncpg.PostgresError) as e:
+            logger.warning(f"LISTEN unavailable, falling back to polling: {e}")
+            self._listen_conn = None
+
+    async def _close_listener(self) -> None:
+        if self._listen_conn is not None:
+            try:
+                await self._listen_conn.close()
+            except Exception as e:
+                logger.debug(f"Error closing LISTEN connection: {e}")
+            self._listen_conn = None
+
+    async def wait_for_frames(self, deadline: float | None = None) -> None:
+        """
+        Sleep until a new frame is notified or the next poll is due.
+
+        Args:
+            deadline: time.monotonic() value at which to poll again, normally the
+                start of the last poll plus poll_interval, so time spent querying
+                does not stretch the polling period. Defaults to poll_interval
+                from now.
+        """
+        if deadline is None:
+            deadline = time.monotonic() + self.poll_interval
+        await self._ensure_listener()
+        timeout = max(0.0, deadline - time.monotonic())
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _prepared(
+        self, conn: asyncpg.Connection, query: str
+    ) -> asyncpg.prepared_stmt.PreparedStatement:
+        """Return `query` prepared on `conn`, preparing it on first use per connection."""
+        stmts = self._stmts.get(conn)
+        if stmts is None:
+            for stale in [c for c in self._stmts if c.is_closed()]:
+                del self._stmts[stale]
+            stmts = self._stmts[conn] = {}
+        stmt = stmts.get(query)
+        if stmt is None:
+            stmt = stmts[query] = await conn.prepare(query)
+        return stmt
+
     async def fetch_pending_frames(self, conn: asyncpg.Connection) -> list[FrameRecord]:
         """
-        Fetch frames that need OCR processing.
+        Claim frames that need OCR processing.
 
-        Uses FOR UPDATE SKIP LOCKED to allow multiple workers safely.
+        Selects pending frames with FOR UPDATE SKIP LOCKED and marks them as
+        processing in the same statement, so the claim is atomic and takes one
+        round trip. It commits immediately; no row locks are held while OCR runs,
+        and other workers skip the claimed frames by status.
 
         Args:
             conn: asyncpg database connection.
@@ -124,35 +479,14 @@ class OCRWorker:
         Returns:
             List of FrameRecord objects for processing.
         """
-        rows = await conn.fetch(
-            """
-            SELECT id, captured_at, image_ref, vision_status
-            FROM frames
-            WHERE vision_status = $1
-            ORDER BY captured_at ASC
-            LIMIT $2
-            FOR UPDATE SKIP LOCKED
-            """,
+        claim = await self._prepared(conn, CLAIM_FRAMES_SQL)
+        rows = await claim.fetch(
             VISION_STATUS_PENDING,
             self.batch_size,
-        )
-        return [FrameRecord(**dict(row)) for row in rows]
-
-    async def mark_frames_processing(
-        self, conn: asyncpg.Connection, frame_ids: list[UUID]
-    ) -> None:
-        """Mark frames as being processed to prevent other workers from picking them up."""
-        if not frame_ids:
-            return
-        await conn.execute(
-            """
-            UPDATE frames
-            SET vision_status = $1
-            WHERE id = ANY($2::uuid[])
-            """,
             VISION_STATUS_PROCESSING,
-            frame_ids,
         )
+        # UPDATE ... RETURNING does not preserve the CTE's ordering
+        return sorted((FrameRecord(**dict(row)) for row in rows), key=lambda f: f.captured_at)
 
     def load_image(self, image_ref: str) -> Image.Image | None:
         """
@@ -166,7 +500,9 @@ class OCRWorker:
             image_ref: Path or URI to the image file.
 
         Returns:
-            PIL Image object or None if loading fails.
+            Decoded PIL Image, already converted to grayscale and downscaled
+            (see prepare_image), or None if loading fails. The caller owns it
+            and should close it once OCR is done.
         
         TODO: Add integration tests for file I/O edge cases:
           - Test loading from absolute file:// URI
@@ -181,24 +517,85 @@ class OCRWorker:
           - Test thread-safety with concurrent load attempts
         """
         try:
-            # Handle file:// URIs
-            if image_ref.startswith("file://"):
-                image_ref = image_ref[7:]
-
-            path = Path(image_ref)
+            path = Path(_local_path(image_ref))
 
             # Check if path exists
             if not path.exists():
                 logger.warning(f"Image file not found: {path}")
                 return None
 
-            # Load and return the image
-            return Image.open(path)
+            image = Image.open(path)
+            # For JPEG, decode straight to grayscale at a reduced DCT scale
+            # instead of materialising full-size RGB first (no-op for other formats)
+            if self.max_width and image.width > self.max_width:
+                image.draft("L", (self.max_width, image.height * self.max_width // image.width))
+            # Decode now, in the calling worker thread; this also releases the file
+            image.load()
+
+            prepared = self.prepare_image(image)
+            if prepared is not image:
+                image.close()
+            return prepared
 
         except Exception as e:
             logger.error(f"Failed to load image {image_ref}: {e}")
             return None
 
+    def prepare_image(self, image: Image.Image) -> Image.Image:
+        """
+        Convert an image to grayscale and cap its width before OCR.
+
+        Tesseract's cost scales with pixel count, and 4K screen captures keep
+        legible text well below full resolution.
+        """
+        if image.mode != "L":
+            image = image.convert("L")
+        width, height = image.size
+        if self.max_width and width > self.max_width:
+            image = image.resize(
+                (self.max_width, max(1, round(height * self.max_width / width))),
+                Image.Resampling.LANCZOS,
+            )
+        return image
+
+    def text_bbox(self, image: Image.Image) -> tuple[int, int, int, int] | None:
+        """
+        Find the bounding box of the regions of a grayscale image that may hold text.
+
+        Flat backgrounds have near-zero variance; glyph edges do not. Variance is
+        measured per tile on a box-filtered reduction, so this costs a small
+        fraction of a Tesseract pass.
+
+        Returns:
+            (left, top, right, bottom) in image pixels, the whole image when it is
+            too small to tile, or None when no tile looks like text.
+        """
+        width, height = image.size
+        small = np.asarray(image.reduce(ROI_DOWNSAMPLE), dtype=np.float32)
+        if small.shape[0] < ROI_TILE or small.shape[1] < ROI_TILE:
+            return 0, 0, width, height
+
+        # Pad the edges out to whole tiles so the last partial row/column is checked too
+        small = np.pad(
+            small,
+            ((0, -small.shape[0] % ROI_TILE), (0, -small.shape[1] % ROI_TILE)),
+            mode="edge",
+        )
+        rows, cols = small.shape[0] // ROI_TILE, small.shape[1] // ROI_TILE
+        tiles = small.reshape(rows, ROI_TILE, cols, ROI_TILE)
+        ys, xs = np.nonzero(tiles.var(axis=(1, 3)) > self.roi_variance_threshold)
+        if ys.size == 0:
+            return None
+
+        # One tile of margin around the active tiles
+        scale = ROI_DOWNSAMPLE * ROI_TILE
+        return (
+            max(0, int(xs.min()) - 1) * scale,
+            max(0, int(ys.min()) - 1) * scale,
+            min(width, (int(xs.max()) + 2) * scale),
+            min(height, (int(ys.max()) + 2) * scale),
+        )
+
     def run_ocr(self, image: Image.Image) -> tuple[str, float | None]:
         """
         Run Tesseract OCR on an image.
@@ -208,6 +605,10 @@ class OCRWorker:
 
         Returns:
             Tuple of (extracted_text, confidence) or ("", None) on failure.
+            Confidence is None unless collect_confidence is set.
+
+        Raises:
+            BrokenProcessPool: If a tesserocr pool process died.
         
         TODO: Add integration tests for Tesseract OCR:
           - Test with actual test images containing known text
@@ -229,103 +630,185 @@ class OCRWorker:
         if not self._check_tesseract():
             raise RuntimeError("Tesseract OCR is not available")
 
-        import pytesseract
-
         try:
-            # Get OCR data with confidence
-            data = pytesseract.image_to_data(
+            image = self.prepare_image(image)
+            if self.roi_variance_threshold is not None:
+                bbox = self.text_bbox(image)
+                if bbox is None:
+                    return "", None
+                image = image.crop(bbox)
+            return self._tesseract(image)
+        except BrokenProcessPool:
+            # Not a per-image failure: let the frame be marked as an error
+            # instead of stored as done with no text
+            raise
+        except Exception as e:
+            logger.error(f"OCR failed: {e}")
+            return "", None
+
+    def run_ocr_path(self, path: str) -> tuple[str, float | None]:
+        """
+        Run Tesseract OCR directly on an image file.
+
+        pytesseract hands a path straight to the Tesseract binary, which decodes
+        it with Leptonica; no PIL decode or temporary image copy is made. Only
+        valid when no preprocessing is wanted (see prepare_image).
+
+        Args:
+            path: Local path of the image file.
+
+        Returns:
+            Tuple of (extracted_text, confidence).
+
+        Raises:
+            pytesseract.TesseractError: If Tesseract fails, e.g. on a missing
+                or unreadable file.
+        """
+        if not self._check_tesseract():
+            raise RuntimeError("Tesseract OCR is not available")
+        return self._tesseract(path)
+
+    def _tesseract(self, image: Image.Image | str) -> tuple[str, float | None]:
+        """
+        Call Tesseract on a PIL image or a file path and collect its text.
+        Callers check _check_tesseract() first, which binds the module or
+        starts the tesserocr pool.
+        """
+        if self._ocr_pool is not None:
+            payload = image if isinstance(image, str) else (image.mode, image.size, image.tobytes())
+            # Called from an OCR thread, so blocking on the result is fine
+            return self._ocr_pool.submit(_tesserocr_run, payload, self.collect_confidence).result()
+
+        pytesseract = self._pytesseract
+
+        if not self.collect_confidence:
+            # Plain text only: no per-word dict to build and walk in Python
+            text = pytesseract.image_to_string(
                 image,
                 lang=self.tesseract_lang,
                 config=self.tesseract_config,
-                output_type=pytesseract.Output.DICT,
             )
+            return text.strip(), None
+
+        # Get OCR data with confidence
+        data = pytesseract.image_to_data(
+            image,
+            lang=self.tesseract_lang,
+            config=self.tesseract_config,
+            output_type=pytesseract.Output.DICT,
+        )
 
-            # Extract text and calculate average confidence
-            texts = []
-            confidences = []
-
-            for i, text in enumerate(data.get("text", [])):
-                if text.strip():
-                    texts.append(text)
-                    conf = data.get("conf", [])[i]
-                    if conf > 0:  # Valid confidence value
-                        confidences.append(conf)
+        # Extract text and calculate average confidence
+        words = [(text, conf) for text, conf in zip(data["text"], data["conf"], strict=True) if text.strip()]
+        confidences = [float(conf) for _, conf in words if float(conf) > 0]  # Valid confidence values
 
-            full_text = " ".join(texts)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else None
+        full_text = " ".join(text for text, _ in words)
+        avg_confidence = sum(confidences) / len(confidences) if confidences else None
 
-            return full_text, avg_confidence
+        return full_text, avg_confidence
 
-        except Exception as e:
-            logger.error(f"OCR failed: {e}")
-            return "", None
-
-    async def update_frame_result(
+    async def update_frame_results(
         self,
         conn: asyncpg.Connection,
-        result: OCRResult,
+        results: list[OCRResult],
     ) -> None:
         """
-        Update the database with OCR results.
+        Write a batch of OCR results to the database.
 
         Updates:
         - ocr_text column with extracted text
         - has_text flag based on text content
         - vision_status to done or error
 
+        Each kind of write is a single statement for the whole batch: one UPDATE
+        for failed frames, one executemany for finished frames and one COPY of
+        the detailed ocr_text rows, instead of up to three round trips per frame.
+        Call inside a transaction so the batch commits atomically.
+
         Args:
             conn: asyncpg database connection.
-            result: OCR processing result.
-        """
-        if result.error:
-            await conn.execute(
-                """
-                UPDATE frames
-                SET vision_status = $1
-                WHERE id = $2
-                """,
-                VISION_STATUS_ERROR,
-                result.frame_id,
+            results: OCR processing results for the batch.
+        """
+        error_ids = []
+        done_rows = []
+        ocr_text_records = []
+        for result in results:
+            if result.error:
+                error_ids.append(result.frame_id)
+                logger.error(f"Frame {result.frame_id} marked as error: {result.error}")
+                continue
+
+            has_text = len(result.text.strip()) >= self.min_text_length
+            done_rows.append(
+                (result.text if has_text else None, has_text, VISION_STATUS_DONE, result.frame_id)
             )
-            logger.error(f"Frame {result.frame_id} marked as error: {result.error}")
-            return
-
-        has_text = len(result.text.strip()) >= self.min_text_length
-
-        await conn.execute(
-            """
-            UPDATE frames
-            SET ocr_text = $1, has_text = $2, vision_status = $3
-            WHERE id = $4
-            """,
-            result.text if has_text else None,
-            has_text,
-            VISION_STATUS_DONE,
-            result.frame_id,
-        )
+            # Also record detailed rows in the ocr_text table
+            if has_text:
+                ocr_text_records.append(
+                    (result.frame_id, result.text, result.confidence, result.language)
+                )
 
-        # Also insert into ocr_text table for detailed records
-        if has_text:
-            await conn.execute(
-                """
-                INSERT INTO ocr_text (frame_id, text, confidence, language)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT DO NOTHING
-                """,
-                result.frame_id,
-                result.text,
-                result.confidence,
-                result.language,
+        if error_ids:
+            mark_error = await self._prepared(conn, MARK_FRAMES_ERROR_SQL)
+            await mark_error.fetch(VISION_STATUS_ERROR, error_ids)
+
+        if done_rows:
+            update_text = await self._prepared(conn, UPDATE_FRAME_TEXT_SQL)
+            await update_text.executemany(done_rows)
+
+        # ocr_text has only a surrogate key, so COPY cannot conflict
+        if ocr_text_records:
+            await bulk_copy_records(
+                "ocr_text",
+                ["frame_id", "text", "confidence", "language"],
+                ocr_text_records,
+                conn=conn,
             )
 
         logger.info(
-            f"Frame {result.frame_id} processed: "
-            f"has_text={has_text}, text_len={len(result.text)}"
+            f"Stored OCR results: {len(done_rows)} done "
+            f"({len(ocr_text_records)} with text), {len(error_ids)} failed"
         )
 
-    async def process_frame(self, frame: FrameRecord) -> OCRResult:
+    def _dedupe_lookup(self, frame: FrameRecord) -> OCRResult | None:
+        """Return a copy of a recent near-duplicate frame's result, if any."""
+        if self.dedupe_max_distance is None or frame.phash64 is None:
+            return None
+        hit = self._recent_text.lookup(frame.phash64, self.dedupe_max_distance)
+        if hit is None:
+            return None
+        text, confidence = hit
+        return OCRResult(
+            frame_id=frame.id,
+            text=text,
+            confidence=confidence,
+            language=self.tesseract_lang,
+        )
+
+    def _dedupe_store(self, frame: FrameRecord, result: OCRResult) -> OCRResult:
+        """Remember a successful result for later near-duplicates and return it."""
+        if self.dedupe_max_distance is not None and frame.phash64 is not None and not result.error:
+            self._recent_text.put(frame.phash64, result.text, result.confidence)
+        return result
+
+    def _process_frame_sync(self, frame: FrameRecord) -> OCRResult:
         """
-        Process a single frame with OCR.
+        OCR a frame, reusing a near-duplicate's text when one was seen recently.
+
+        Args:
+            frame: Frame record to process.
+
+        Returns:
+            OCRResult with extracted text or error.
+        """
+        cached = self._dedupe_lookup(frame)
+        if cached is not None:
+            return cached
+        return self._dedupe_store(frame, self._ocr_frame_sync(frame))
+
+    def _ocr_frame_sync(self, frame: FrameRecord) -> OCRResult:
+        """
+        Load a frame's image and run OCR on it, blocking the calling thread.
 
         Args:
             frame: Frame record to process.
@@ -334,17 +817,31 @@ class OCRWorker:
             OCRResult with extracted text or error.
         """
         try:
+            if self.max_width is None and not frame.image_ref.startswith(("http://", "https://")):
+                # No preprocessing configured: let Tesseract read the file itself.
+                # A missing file surfaces as a TesseractError, recorded below.
+                text, confidence = self.run_ocr_path(_local_path(frame.image_ref))
+                return OCRResult(
+                    frame_id=frame.id,
+                    text=text,
+                    confidence=confidence,
+                    language=self.tesseract_lang,
+                )
+
             # Load the image
             image = self.load_image(frame.image_ref)
             if image is None:
                 return OCRResult(
                     frame_id=frame.id,
                     text="",
-                    error=f"Could not load image: {frame.image_ref}",
+                    error=f"{ERR_IMAGE_LOAD}: {frame.image_ref}",
                 )
 
-            # Run OCR
-            text, confidence = self.run_ocr(image)
+            # Run OCR, then free the decoded pixels right away
+            try:
+                text, confidence = self.run_ocr(image)
+            finally:
+                image.close()
 
             return OCRResult(
                 frame_id=frame.id,
@@ -361,75 +858,239 @@ class OCRWorker:
                 error=str(e),
             )
 
+    async def process_frame(self, frame: FrameRecord) -> OCRResult:
+        """
+        Process a single frame with OCR in a worker thread.
+
+        Image decoding and Tesseract are blocking, CPU-bound calls; running them
+        off the event loop keeps database I/O and notifications flowing.
+
+        Args:
+            frame: Frame record to process.
+
+        Returns:
+            OCRResult with extracted text or error.
+        """
+        return await asyncio.to_thread(self._process_frame_sync, frame)
+
+    @property
+    def batches_paths(self) -> bool:
+        """Whether frames can be passed to one Tesseract run as a list of file paths."""
+        return (
+            self.ocr_batch_size > 1
+            and self.max_width is None
+            and not self.collect_confidence
+            and self._ocr_pool is None  # pool processes keep their engine loaded already
+        )
+
+    def _run_ocr_batch(self, paths: list[str]) -> list[str]:
+        """
+        OCR several image files with a single Tesseract process.
+
+        Tesseract treats a .txt input as a list of images and writes each page's
+        text followed by a form feed, so process start-up and LSTM model loading
+        are paid once per batch instead of once per frame.
+
+        Args:
+            paths: Local image file paths.
+
+        Returns:
+            Extracted text per path, in order.
+
+        Raises:
+            RuntimeError: If Tesseract is unavailable, fails, or returns an
+                unexpected page count.
+        """
+        if not self._check_tesseract():
+            raise RuntimeError("Tesseract OCR is not available")
+
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as list_file:
+            list_file.write("\n".join(paths) + "\n")
+        try:
+            proc = subprocess.run(
+                [
+                    self._pytesseract.pytesseract.tesseract_cmd,
+                    list_file.name,
+                    "stdout",
+                    "-l",
+                    self.tesseract_lang,
+                    *shlex.split(self.tesseract_config),
+                ],
+                capture_output=True,
+                text=True,
+            )
+        finally:
+            os.unlink(list_file.name)
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"Tesseract batch failed: {proc.stderr.strip()}")
+        pages = proc.stdout.split("\f")
+        if len(pages) == len(paths) + 1 and not pages[-1].strip():
+            pages.pop()  # trailing separator after the last page
+        if len(pages) != len(paths):
+            raise RuntimeError(f"Tesseract returned {len(pages)} pages for {len(paths)} images")
+        return [page.strip() for page in pages]
+
+    def _process_frames_sync(self, frames: list[FrameRecord]) -> list[OCRResult]:
+        """
+        OCR a group of frames with one Tesseract run, blocking the calling thread.
+
+        Missing files are reported per frame up front. If the batch run fails,
+        the frames are retried one by one so a single bad image only fails itself.
+        """
+        results: dict[UUID, OCRResult] = {}
+        batch = []
+        for frame in frames:
+            cached = self._dedupe_lookup(frame)
+            if cached is not None:
+                results[frame.id] = cached
+                continue
+            path = _local_path(frame.image_ref)
+            if os.path.isfile(path):
+                batch.append((frame, path))
+            else:
+                results[frame.id] = OCRResult(
+                    frame_id=frame.id,
+                    text="",
+                    error=f"{ERR_IMAGE_LOAD}: {frame.image_ref}",
+                )
+
+        if batch:
+            try:
+                texts = self._run_ocr_batch([path for _, path in batch])
+                for (frame, _), text in zip(batch, texts, strict=True):
+                    results[frame.id] = self._dedupe_store(
+                        frame,
+                        OCRResult(frame_id=frame.id, text=text, language=self.tesseract_lang),
+                    )
+            except Exception as e:
+                logger.warning(f"Batch OCR of {len(batch)} frames failed, retrying singly: {e}")
+                for frame, _ in batch:
+                    results[frame.id] = self._process_frame_sync(frame)
+
+        return [results[frame.id] for frame in frames]
+
+    async def process_frames(self, frames: list[FrameRecord]) -> list[OCRResult]:
+        """
+        Process frames with OCR in a worker thread, batching Tesseract runs when possible.
+
+        Args:
+            frames: Frame records to process.
+
+        Returns:
+            OCRResults aligned with `frames`.
+        """
+        if not self.batches_paths:
+            return [await self.process_frame(frame) for frame in frames]
+        return await asyncio.to_thread(self._process_frames_sync, frames)
+
     async def process_batch(self, conn: asyncpg.Connection) -> int:
         """
         Process a batch of frames.
 
+        Never issues a bare BEGIN/COMMIT: the result write uses conn.transaction(),
+        which becomes a savepoint when `conn` is already in a transaction, so a
+        caller can run the batch inside its own transaction and roll it back.
+
         Args:
             conn: asyncpg database connection.
 
         Returns:
             Number of frames processed.
         """
-        # Fetch pending frames
+        # Claim pending frames (marked as processing in the same statement)
         frames = await self.fetch_pending_frames(conn)
         if not frames:
             return 0
 
         logger.info(f"Processing {len(frames)} frames")
 
-        # Mark as processing
-        frame_ids = [f.id for f in frames]
-        await self.mark_frames_processing(conn, frame_ids)
+        # OCR frames concurrently; Tesseract runs outside the GIL, so up to
+        # ocr_concurrency frames are processed in parallel threads
+        semaphore = asyncio.Semaphore(self.ocr_concurrency)
 
-        # Process each frame
-        results = []
-        for frame in frames:
-            result = await self.process_frame(frame)
-            results.append(result)
+        async def _bounded(group: list[FrameRecord]) -> list[OCRResult]:
+            async with semaphore:
+                return await self.process_frames(group)
+
+        group_size = self.ocr_batch_size if self.batches_paths else 1
+        groups = [frames[i:i + group_size] for i in range(0, len(frames), group_size)]
+        results = [
+            result
+            for group_results in await asyncio.gather(*(_bounded(group) for group in groups))
+            for result in group_results
+        ]
 
         # Update results in a transaction
         async with conn.transaction():
-            for result in results:
-                await self.update_frame_result(conn, result)
+            await self.update_frame_results(conn, results)
 
         return len(frames)
 
-    async def run_with_retry(self, conn: asyncpg.Connection) -> int:
+    async def _with_retry(self, operation: Callable[[asyncpg.Connection], Awaitable[T]]) -> T:
         """
-        Run a processing cycle with retry logic for transient errors.
+        Run `operation(conn)` with retries for transient database errors.
+
+        Each attempt checks out a fresh connection: after a failure the previous
+        one may be in an aborted transaction, where every statement would fail
+        with InFailedSqlTransactionError.
+
+        - Serialization failures and deadlocks are retried immediately, since
+          the conflicting transaction has already been resolved.
+        - Connection failures back off exponentially from retry_delay, with up
+          to 10% jitter so workers don't reconnect in lockstep.
+        - Anything else is not transient and is raised.
 
         Args:
-            conn: asyncpg database connection.
+            operation: Coroutine function taking a connection.
 
         Returns:
-            Number of frames processed.
+            The operation's result.
         """
-        last_error = None
-        for attempt in range(self.max_retries):
+        for attempt in range(1, self.max_retries + 1):
             try:
-                return await self.process_batch(conn)
-            except asyncpg.PostgresError as e:
-                last_error = e
-                delay = self.retry_delay * (2**attempt)
+                async with get_db_connection() as conn:
+                    return await operation(conn)
+            except RETRY_IMMEDIATELY_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
                 logger.warning(
-                    f"Database error (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                    f"Retrying in {delay}s"
+                    f"Transaction conflict (attempt {attempt}/{self.max_retries}): {e}. "
+                    "Retrying"
+                )
+            except RETRY_WITH_BACKOFF_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_delay * (2 ** (attempt - 1))
+                delay += random.uniform(0, delay * 0.1)
+                logger.warning(
+                    f"Database connection error (attempt {attempt}/{self.max_retries}): {e}. "
+                    f"Retrying in {delay:.2f}s"
                 )
                 await asyncio.sleep(delay)
-            except Exception as e:
-                logger.error(f"Unexpected error in processing cycle: {e}")
-                raise
+        raise AssertionError("unreachable")  # the last attempt returns or raises
+
+    async def run_with_retry(self) -> int:
+        """
+        Run a processing cycle with retry logic for transient errors.
 
-        logger.error(f"Max retries exceeded. Last error: {last_error}")
-        return 0
+        Returns:
+            Number of frames processed, or 0 if retries were exhausted.
+        """
+        try:
+            return await self._with_retry(self.process_batch)
+        except (*RETRY_IMMEDIATELY_ERRORS, *RETRY_WITH_BACKOFF_ERRORS) as e:
+            logger.error(f"Max retries exceeded. Last error: {e}")
+            return 0
 
     async def run(self) -> None:
         """
         Main worker loop.
 
-        Continuously polls for unprocessed frames and runs OCR.
-        Runs until stopped via the running flag or KeyboardInterrupt.
+        Runs a fetch -> OCR -> write pipeline over unprocessed frames: one task
+        claims frames, ocr_concurrency tasks OCR them in threads, and one task
+        writes the results back in batches. Runs until stopped via the running
+        flag or KeyboardInterrupt.
         
         TODO: Add integration test for the polling loop:
           - Test that worker continuously fetches pending frames
@@ -452,11 +1113,13 @@ class OCRWorker:
         self.running = True
         logger.info(
             f"OCR Worker started (batch_size={self.batch_size}, "
-            f"poll_interval={self.poll_interval}s)"
+            f"poll_interval={self.poll_interval}s, "
+            f"range={self.poll_interval_min}-{self.poll_interval_max}s)"
         )
 
-        # Check Tesseract availability at startup
-        if not self._check_tesseract():
+        # Check Tesseract availability at startup, off the loop: starting and
+        # probing the tesserocr pool can take a while
+        if not await asyncio.to_thread(self._check_tesseract):
             logger.error(
                 "Tesseract OCR is not available. "
                 "Install with: apt install tesseract-ocr libtesseract-dev"
@@ -464,27 +1127,134 @@ class OCRWorker:
             self.running = False
             return
 
+        self._wakeup = asyncio.Event()
+        await self._ensure_listener()
+        await warm_async_pool()
+
+        # fetch -> OCR -> write pipeline: while frames are being OCR'd, the next
+        # batch is claimed and finished results are written. Bounded queues cap
+        # how many claimed frames (and decoded images) are in flight.
+        fetch_q: asyncio.Queue[FrameRecord | None] = asyncio.Queue(maxsize=self.batch_size * 2)
+        write_q: asyncio.Queue[OCRResult | None] = asyncio.Queue(maxsize=self.batch_size * 2)
+        ocr_tasks = [
+            asyncio.create_task(self._ocr_stage(fetch_q, write_q))
+            for _ in range(self.ocr_concurrency)
+        ]
+        writer = asyncio.create_task(self._write_stage(write_q))
+
+        try:
+            await self._fetch_stage(fetch_q)
+        except asyncio.CancelledError:
+            logger.info("Worker cancelled")
+            self.running = False
+        finally:
+            # Let frames already claimed finish, then stop each stage in order
+            for _ in ocr_tasks:
+                await fetch_q.put(None)
+            await asyncio.gather(*ocr_tasks)
+            await write_q.put(None)
+            await writer
+            await self._close_listener()
+            if self._ocr_pool is not None:
+                await asyncio.to_thread(self._ocr_pool.shutdown)
+                self._ocr_pool = None
+                self._tesseract_available = None
+
+        logger.info("OCR Worker stopped")
+
+    async def _fetch_stage(self, fetch_q: "asyncio.Queue[FrameRecord | None]") -> None:
+        """Claim pending frames into `fetch_q` until stopped, waiting while idle."""
         while self.running:
             try:
-                async with get_db_connection() as conn:
-                    processed = await self.run_with_retry(conn)
-
-                    if processed == 0:
-                        # No frames to process, wait before next poll
-                        await asyncio.sleep(self.poll_interval)
-                    else:
-                        # Processed frames, immediately check for more
-                        logger.info(f"Processed {processed} frames")
+                # The fallback poll is scheduled from when this one started
+                poll_started = time.monotonic()
+                frames = await self._with_retry(self.fetch_pending_frames)
+
+                if frames:
+                    logger.info(f"Processing {len(frames)} frames")
+                    # Poll again soon after finding work
+                    self._cur_interval = self.poll_interval_min
+                    for frame in frames:
+                        # Blocks while the OCR stage is saturated (backpressure)
+                        await fetch_q.put(frame)
+                    continue
+
+                # Back off while idle; wait for a notification or the next poll
+                self._cur_interval = min(
+                    self._cur_interval * self.poll_backoff, self.poll_interval_max
+                )
+                await self.wait_for_frames(poll_started + self._cur_interval)
 
             except asyncio.CancelledError:
-                logger.info("Worker cancelled")
-                self.running = False
-                break
+                raise
             except Exception as e:
-                logger.exception(f"Error in worker loop: {e}")
-                await asyncio.sleep(self.poll_interval)
+                logger.exception(f"Error fetching frames: {e}")
+                # At least retry_delay, so poll_interval=0 does not spin on errors
+                await asyncio.sleep(max(self.poll_interval, self.retry_delay))
 
-        logger.info("OCR Worker stopped")
+    async def _ocr_stage(
+        self,
+        fetch_q: "asyncio.Queue[FrameRecord | None]",
+        write_q: "asyncio.Queue[OCRResult | None]",
+    ) -> None:
+        """
+        OCR frames from `fetch_q` in a worker thread until a None sentinel arrives.
+
+        When Tesseract runs can be batched, frames already waiting in the queue
+        (up to ocr_batch_size) are taken together.
+        """
+        stopping = False
+        while not stopping and (frame := await fetch_q.get()) is not None:
+            frames = [frame]
+            while self.batches_paths and len(frames) < self.ocr_batch_size and not fetch_q.empty():
+                frame = fetch_q.get_nowait()
+                if frame is None:
+                    stopping = True
+                    break
+                frames.append(frame)
+            for result in await self.process_frames(frames):
+                await write_q.put(result)
+
+    async def _write_stage(self, write_q: "asyncio.Queue[OCRResult | None]") -> None:
+        """
+        Write OCR results in batches of up to batch_size until a None sentinel arrives.
+
+        After the first result of a batch arrives, more are collected for at most
+        WRITE_LINGER seconds, so results finishing close together share one
+        transaction without delaying a lone result for long.
+        """
+        done = False
+        while not done:
+            result = await write_q.get()
+            if result is None:
+                break
+            results = [result]
+            deadline = time.monotonic() + WRITE_LINGER
+            while len(results) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    result = await asyncio.wait_for(write_q.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if result is None:
+                    done = True
+                    break
+                results.append(result)
+            await self._flush_results(results)
+
+    async def _flush_results(self, results: list[OCRResult]) -> None:
+        """Write a batch of results in one transaction, retrying transient errors."""
+
+        async def _write(conn: asyncpg.Connection) -> None:
+            async with conn.transaction():
+                await self.update_frame_results(conn, results)
+
+        try:
+            await self._with_retry(_write)
+        except Exception as e:
+            logger.exception(f"Failed to store {len(results)} OCR results: {e}")
 
     def stop(self) -> None:
         """Signal the worker to stop gracefully."""
@@ -507,13 +1277,30 @@ async def main() -> None:
         "--poll-interval",
         type=float,
         default=5.0,
-        help="Seconds to wait between polling cycles (default: 5.0)",
+        help="Initial seconds between polling cycles when no notification arrives (default: 5.0)",
+    )
+    parser.add_argument(
+        "--poll-interval-max",
+        type=float,
+        default=30.0,
+        help="Upper bound for the idle polling interval (default: 30.0)",
     )
     parser.add_argument(
         "--lang",
         default="eng",
         help="Tesseract language code (default: eng)",
     )
+    parser.add_argument(
+        "--tesseract-config",
+        default=settings.ocr_tesseract_config,
+        help="Extra Tesseract flags, e.g. '--oem 1 --psm 6' (default: AGENTS_OCR_TESSERACT_CONFIG or none)",
+    )
+    parser.add_argument(
+        "--max-width",
+        type=int,
+        default=1600,
+        help="Downscale images wider than this before OCR; 0 disables and lets Tesseract read files directly (default: 1600)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -532,7 +1319,10 @@ async def main() -> None:
     worker = OCRWorker(
         batch_size=args.batch_size,
         poll_interval=args.poll_interval,
+        poll_interval_max=args.poll_interval_max,
         tesseract_lang=args.lang,
+        tesseract_config=args.tesseract_config,
+        max_width=args.max_width or None,
     )
 
     try:
@@ -542,4 +1332,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -15,17 +15,35 @@ Vision status values:
 
 import argparse
 import asyncio
-import base64
 import logging
 import mimetypes
+import random
+import string
+import time
+import warnings
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, TypeVar
 from uuid import UUID
 
 import asyncpg
 
-from agents.database.connection import get_db_connection
+try:
+    import pybase64
+except ImportError:  # optional SIMD base64; the stdlib module has the same API
+    import base64 as pybase64
+
+try:
+    import uvloop
+except ImportError:  # optional; the stdlib event loop is used instead
+    uvloop = None
+
+from agents.database.connection import get_db_connection, warm_async_pool
+from agents.errors import LLMConnectionError, LLMRateLimitError, LLMServerError
+from agents.helpers.async_helpers import AsyncTokenBucket
+from agents.processors.ocr_worker import RETRY_IMMEDIATELY_ERRORS, RETRY_WITH_BACKOFF_ERRORS
 from agents.llm_api.llm_client import LLMClient
 from agents.schemas.agents_message_content import ImageContent, TextContent
 from agents.schemas.enums import MessageRole
@@ -42,12 +60,155 @@ VISION_STATUS_VISION_PROCESSING = 3
 VISION_STATUS_VISION_DONE = 4
 VISION_STATUS_ERROR = -1
 
+# VisionResult.error values; ERR_IMAGE_LOAD is a prefix, followed by ": " and
+# the image_ref
+ERR_IMAGE_LOAD = "Could not load image"
+ERR_NO_SUMMARY = "LLM Vision API returned no summary"
+
 # Default vision prompt
 DEFAULT_VISION_PROMPT = """You are analyzing a screenshot from a user's computer.
 The OCR extracted text is: {ocr_text}
 
 Describe concisely (1-2 sentences) what application/window is visible and what the user is likely doing. Focus on the activity, not UI elements."""
 
+# LLM failures worth another attempt: rate limits, provider 5xx, network, timeouts
+RETRYABLE_LLM_ERRORS = (
+    LLMRateLimitError,
+    LLMServerError,
+    LLMConnectionError,
+    asyncio.TimeoutError,
+)
+
+# MIME types of the formats frames are captured in; anything else is looked up
+IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+
+# Read size for streaming base64 encoding. 48 KiB is a multiple of 3, so each
+# chunk encodes to complete base64 quanta with no padding between chunks.
+ENCODE_CHUNK_SIZE = 48 * 1024
+
+# Recent (phash, summary) pairs kept per worker for near-duplicate frames
+RECENT_SUMMARY_CACHE_SIZE = 256
+
+# Rough input-token cost of one screenshot, for the tokens-per-minute budget
+IMAGE_TOKEN_ESTIMATE = 1000
+
+
+def _split_prompt(template: str) -> tuple[str, str] | None:
+    """
+    Split a prompt template around its single plain {ocr_text} field.
+
+    Returns the literal (unescaped) text before and after the field, or None
+    when the template has other fields, format specs or conversions and must
+    go through str.format.
+    """
+    parts = list(string.Formatter().parse(template))
+    fields = [i for i, (_, name, _, _) in enumerate(parts) if name is not None]
+    if len(fields) != 1:
+        return None
+    i = fields[0]
+    _, name, spec, conversion = parts[i]
+    if name != "ocr_text" or spec or conversion:
+        return None
+    return (
+        "".join(literal for literal, *_ in parts[: i + 1]),
+        "".join(literal for literal, *_ in parts[i + 1 :]),
+    )
+
+
+T = TypeVar("T")
+
+# Hot-path statements, prepared once per connection (see VisionWorker._prepared)
+CLAIM_FRAMES_SQL = """
+    WITH claimed AS (
+        SELECT id, captured_at
+        FROM frames
+        WHERE vision_status = $1
+        ORDER BY captured_at ASC
+        LIMIT $2
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE frames f
+    SET vision_status = $3
+    FROM claimed
+    -- The frame captured just before, whose summary a near-duplicate can reuse
+    LEFT JOIN LATERAL (
+        SELECT p.phash, p.vision_summary
+        FROM frames p
+        WHERE p.captured_at < claimed.captured_at
+        ORDER BY p.captured_at DESC
+        LIMIT 1
+    ) prev ON true
+    WHERE f.id = claimed.id AND f.captured_at = claimed.captured_at
+    RETURNING f.id, f.captured_at, f.image_ref, f.ocr_text, f.vision_status,
+              f.phash AS phash64, prev.phash AS prev_phash64,
+              prev.vision_summary AS prev_summary
+"""
+
+UPDATE_FRAME_RESULTS_SQL = """
+    UPDATE frames
+    SET vision_summary = COALESCE(data.summary, frames.vision_summary),
+        vision_status = data.status
+    FROM unnest($1::uuid[], $2::text[], $3::int[]) AS data(id, summary, status)
+    WHERE frames.id = data.id
+"""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limit that adapts to provider rate limiting (AIMD).
+
+    Used as an async context manager around each LLM call. The limit halves on
+    every rate-limit response and grows back by about one slot per limit's
+    worth of successful calls, up to `max_limit`.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+    def on_rate_limited(self) -> None:
+        self.limit = max(1.0, self.limit / 2)
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """
+    Seconds the provider asked to wait, from the Retry-After headers of the
+    SDK error an LLM error was raised from, if any.
+    """
+    original = error.__cause__ or error.__context__
+    response = getattr(original, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):  # e.g. an HTTP-date Retry-After
+        pass
+    return None
+
 
 @dataclass
 class VisionResult:
@@ -67,6 +228,14 @@ class VisionFrameRecord:
     image_ref: str
     ocr_text: str | None = None
     vision_status: int = 0
+    phash64: int | None = None
+    prev_phash64: int | None = None
+    prev_summary: str | None = None
+
+
+def _hamming64(a: int, b: int) -> int:
+    # Mask to 64 bits: phash64 is stored as a signed BIGINT
+    return bin((a ^ b) & 0xFFFFFFFFFFFFFFFF).count("1")
 
 
 class VisionWorker:
@@ -91,22 +260,58 @@ class VisionWorker:
         model_endpoint: str | None = None,
         max_tokens: int = 150,
         vision_prompt: str | None = None,
-        rate_limit_delay: float = 0.5,
+        max_concurrency: int = 5,
+        requests_per_minute: float | None = 120.0,
+        tokens_per_minute: int | None = None,
+        request_timeout: float = 20.0,
+        llm_max_retries: int = 3,
+        flush_interval: float = 0.5,
+        dedupe_threshold: int | None = 4,
+        dedupe_max_ocr_chars: int = 200,
+        rate_limit_delay: float | None = None,
     ):
         """
         Initialize the Vision worker.
 
         Args:
             batch_size: Number of frames to process per batch.
-            poll_interval: Seconds to wait between polling cycles.
+            poll_interval: Seconds to wait between polling cycles (0 polls
+                again as soon as a poll comes back empty, e.g. in tests).
             max_retries: Maximum retry attempts for database errors.
-            retry_delay: Base delay between retries (exponential backoff).
+            retry_delay: Base delay between database and LLM retries
+                (exponential backoff).
             model: LLM model to use for vision (e.g., 'gpt-4o', 'claude-3-5-sonnet-latest').
             model_endpoint: Optional custom model endpoint URL.
             max_tokens: Maximum tokens for LLM response.
             vision_prompt: Custom prompt template for vision analysis.
-            rate_limit_delay: Delay between API calls to avoid rate limits.
+            max_concurrency: Maximum LLM calls in flight at once.
+            requests_per_minute: Provider request rate limit to stay under;
+                bursts of up to max_concurrency calls are allowed. None disables.
+            tokens_per_minute: Provider token rate limit to stay under, charged
+                per call with an estimate of prompt, image and output tokens.
+                None disables.
+            request_timeout: Seconds one LLM call may take before it is abandoned.
+            llm_max_retries: Attempts per LLM call, retrying only rate limits,
+                server errors, connection failures and timeouts.
+            flush_interval: Longest a finished summary waits for others to share
+                its database write.
+            dedupe_threshold: Frames with little text whose phash is within this
+                many bits of the previous frame, or of a recently summarized
+                one, reuse that summary instead of calling the LLM. None
+                disables.
+            dedupe_max_ocr_chars: Only frames with less OCR text than this are
+                deduplicated; text-heavy frames may differ where the hash can't tell.
+            rate_limit_delay: Deprecated; use requests_per_minute. Seconds
+                between LLM calls, mapped to 60 / rate_limit_delay requests per
+                minute (0 disables).
         """
+        if rate_limit_delay is not None:
+            warnings.warn(
+                "VisionWorker(rate_limit_delay=...) is deprecated; use requests_per_minute",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            requests_per_minute = 60 / rate_limit_delay if rate_limit_delay > 0 else None
         self.batch_size = batch_size
         self.poll_interval = poll_interval
         self.max_retries = max_retries
@@ -115,29 +320,79 @@ class VisionWorker:
         self.model_endpoint = model_endpoint
         self.max_tokens = max_tokens
         self.vision_prompt = vision_prompt or DEFAULT_VISION_PROMPT
-        self.rate_limit_delay = rate_limit_delay
+        # Templates are parsed once here instead of by str.format on every frame
+        self._prompt_parts = _split_prompt(self.vision_prompt)
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_timeout = request_timeout
+        self.llm_max_retries = max(1, llm_max_retries)
+        self.flush_interval = flush_interval
+        self.dedupe_threshold = dedupe_threshold
+        self.dedupe_max_ocr_chars = dedupe_max_ocr_chars
+        self._recent_summaries: OrderedDict[int, str] = OrderedDict()
+        self._rpm_bucket = (
+            AsyncTokenBucket(self.max_concurrency, requests_per_minute / 60)
+            if requests_per_minute
+            else None
+        )
+        self._tpm_bucket = (
+            AsyncTokenBucket(tokens_per_minute, tokens_per_minute / 60)
+            if tokens_per_minute
+            else None
+        )
+        self._limiter = AdaptiveConcurrencyLimiter(self.max_concurrency)
         self.running = False
         self._llm_client: LLMClient | None = None
+        # Prepared statements are connection-scoped, so they are kept per
+        # pooled connection; entries for closed connections are dropped
+        self._stmts: dict[
+            asyncpg.Connection, dict[str, asyncpg.prepared_stmt.PreparedStatement]
+        ] = {}
 
     def _get_llm_client(self) -> LLMClient:
-        """Get or create the LLM client."""
+        """
+        Get or create the LLM client.
+
+        Called once at startup (run or process_batch); the per-frame path then
+        uses self._llm_client directly.
+        """
         if self._llm_client is None:
             config = LLMConfig.default_config(self.model)
             if self.model_endpoint:
                 config.model_endpoint = self.model_endpoint
             config.max_tokens = self.max_tokens
-            self._llm_client = LLMClient.create(config)
-            if not self._llm_client:
+            client = LLMClient.create(config)
+            if not client:
                 raise ValueError(f"Failed to create LLM client for model {self.model}")
+            # _send_with_retry is the only retry policy; SDK retries would run
+            # inside its request_timeout and multiply the attempts
+            client.max_retries = 0
+            self._llm_client = client
         return self._llm_client
 
-    async def fetch_ocr_done_frames(
-        self, conn: asyncpg.Connection
-    ) -> list[VisionFrameRecord]:
+    async def _prepared(
+        self, conn: asyncpg.Connection, query: str
+    ) -> asyncpg.prepared_stmt.PreparedStatement:
+        """Return `query` prepared on `conn`, preparing it on first use per connection."""
+        stmts = self._stmts.get(conn)
+        if stmts is None:
+            for stale in [c for c in self._stmts if c.is_closed()]:
+                del self._stmts[stale]
+            stmts = self._stmts[conn] = {}
+        stmt = stmts.get(query)
+        if stmt is None:
+            stmt = stmts[query] = await conn.prepare(query)
+        return stmt
+
+    async def claim_frames(self, conn: asyncpg.Connection) -> list[VisionFrameRecord]:
         """
-        Fetch frames that have completed OCR and need vision processing.
+        Claim frames that have completed OCR and need vision processing.
 
-        Uses FOR UPDATE SKIP LOCKED to allow multiple workers safely.
+        Selects OCR-done frames with FOR UPDATE SKIP LOCKED and marks them as
+        vision-processing in the same statement, so the claim is atomic and
+        takes one round trip. It commits immediately; other workers skip the
+        claimed frames by status while the LLM calls run.
 
         Args:
             conn: asyncpg database connection.
@@ -145,40 +400,23 @@ class VisionWorker:
         Returns:
             List of VisionFrameRecord objects for processing.
         """
-        rows = await conn.fetch(
-            """
-            SELECT id, captured_at, image_ref, ocr_text, vision_status
-            FROM frames
-            WHERE vision_status = $1
-            ORDER BY captured_at ASC
-            LIMIT $2
-            FOR UPDATE SKIP LOCKED
-            """,
+        claim = await self._prepared(conn, CLAIM_FRAMES_SQL)
+        rows = await claim.fetch(
             VISION_STATUS_OCR_DONE,
             self.batch_size,
-        )
-        return [VisionFrameRecord(**dict(row)) for row in rows]
-
-    async def mark_frames_processing(
-        self, conn: asyncpg.Connection, frame_ids: list[UUID]
-    ) -> None:
-        """Mark frames as being processed to prevent other workers from picking them up."""
-        if not frame_ids:
-            return
-        await conn.execute(
-            """
-            UPDATE frames
-            SET vision_status = $1
-            WHERE id = ANY($2::uuid[])
-            """,
             VISION_STATUS_VISION_PROCESSING,
-            frame_ids,
+        )
+        # UPDATE ... RETURNING does not preserve the CTE's ordering
+        return sorted(
+            (VisionFrameRecord(**dict(row)) for row in rows), key=lambda f: f.captured_at
         )
 
     def load_image_base64(self, image_ref: str) -> tuple[str, str] | None:
         """
         Load an image and encode it as base64.
 
+        Blocking; process_frame calls it through asyncio.to_thread.
+
         Args:
             image_ref: Path or URI to the image file.
 
@@ -211,28 +449,33 @@ class VisionWorker:
                 return None
 
             # Determine MIME type
-            mime_type, _ = mimetypes.guess_type(str(path))
-            if mime_type is None or not mime_type.startswith("image/"):
-                mime_type = "image/jpeg"
-
-            # Read and encode
+            mime_type = IMAGE_MIME_TYPES.get(path.suffix.lower())
+            if mime_type is None:
+                mime_type, _ = mimetypes.guess_type(str(path))
+                if mime_type is None or not mime_type.startswith("image/"):
+                    mime_type = "image/jpeg"
+
+            # Read and encode chunk by chunk straight after the data URI prefix,
+            # so neither the raw file nor a separate base64 copy is held in full
+            buf = bytearray(f"data:{mime_type};base64,".encode("ascii"))
             with open(path, "rb") as img_file:
-                base64_string = base64.b64encode(img_file.read()).decode("utf-8")
-                data_uri = f"data:{mime_type};base64,{base64_string}"
-                return data_uri, mime_type
+                while chunk := img_file.read(ENCODE_CHUNK_SIZE):
+                    buf += pybase64.b64encode(chunk)
+            return buf.decode("ascii"), mime_type
 
         except Exception as e:
             logger.error(f"Failed to load image {image_ref}: {e}")
             return None
 
-    def generate_summary(
-        self, image_data_uri: str, ocr_text: str | None
+    async def generate_summary(
+        self, image_id: str, ocr_text: str | None
     ) -> str | None:
         """
         Generate a summary for the frame using the LLM Vision API.
 
         Args:
-            image_data_uri: Base64-encoded image data URI.
+            image_id: Base64-encoded image data URI or remote image URL; the
+                client converters send either to the provider as-is.
             ocr_text: OCR text extracted from the image (may be None).
 
         Returns:
@@ -255,27 +498,37 @@ class VisionWorker:
           - Test recovery from transient failures
         """
         try:
-            client = self._get_llm_client()
+            client = self._llm_client
 
-            # Format the prompt with OCR text
+            # Format the prompt with OCR text; the slice returns ocr_text itself
+            # when it is already short enough, so only long texts are copied
             ocr_context = ocr_text[:1000] if ocr_text else "(no text detected)"
-            prompt_text = self.vision_prompt.format(ocr_text=ocr_context)
-
-            # Construct the message with image
-            message = Message(
+            if self._prompt_parts is not None:
+                prefix, suffix = self._prompt_parts
+                prompt_text = f"{prefix}{ocr_context}{suffix}"
+            else:
+                prompt_text = self.vision_prompt.format(ocr_text=ocr_context)
+
+            # Construct the message with image. The inputs are built here and
+            # already well-typed, so model_construct skips pydantic validation
+            message = Message.model_construct(
                 role=MessageRole.user,
                 content=[
-                    TextContent(text=prompt_text),
-                    ImageContent(image_id=image_data_uri),
+                    TextContent.model_construct(text=prompt_text),
+                    ImageContent.model_construct(image_id=image_id),
                 ],
             )
 
-            # Call the LLM
-            response = client.send_llm_request(messages=[message])
+            response = await self._send_with_retry(
+                client, message, self.estimate_tokens(ocr_text)
+            )
 
             # Extract the summary from response
             if response and response.choices:
-                return response.choices[0].message.content
+                choice = response.choices[0]
+                if choice.finish_reason == "length":
+                    logger.warning(f"Vision summary truncated at max_tokens={self.max_tokens}")
+                return choice.message.content
 
             return None
 
@@ -283,46 +536,121 @@ class VisionWorker:
             logger.error(f"Failed to generate vision summary: {e}")
             return None
 
-    async def update_frame_result(
+    async def _send_with_retry(self, client: LLMClient, message: Message, est_tokens: int) -> Any:
+        """
+        Send one LLM request under the rate limits, a timeout and a retry policy.
+
+        Every attempt waits for rate-limit budget, so retries after a 429 are
+        paced too, and runs under the adaptive concurrency limit, which halves
+        on each 429. Retryable errors back off exponentially with jitter, or for
+        as long as the provider's Retry-After asks; others and the final failure
+        propagate.
+        """
+        for attempt in range(self.llm_max_retries):
+            if self._rpm_bucket is not None:
+                await self._rpm_bucket.acquire(1)
+            if self._tpm_bucket is not None:
+                await self._tpm_bucket.acquire(est_tokens)
+            try:
+                async with self._limiter:
+                    response = await asyncio.wait_for(
+                        client.send_llm_request_async(messages=[message]),
+                        timeout=self.request_timeout,
+                    )
+                self._limiter.on_success()
+                return response
+            except RETRYABLE_LLM_ERRORS as e:
+                retry_after = None
+                if isinstance(e, LLMRateLimitError):
+                    self._limiter.on_rate_limited()
+                    retry_after = _retry_after(e)
+                    logger.info(f"Rate limited; LLM concurrency now {int(self._limiter.limit)}")
+                if attempt + 1 >= self.llm_max_retries:
+                    raise
+                if retry_after is not None:
+                    delay = retry_after
+                else:
+                    delay = self.retry_delay * (2**attempt) * random.uniform(0.5, 1.5)
+                logger.warning(
+                    f"LLM request failed (attempt {attempt + 1}/{self.llm_max_retries}): "
+                    f"{type(e).__name__}: {e}. Retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    def estimate_tokens(self, ocr_text: str | None) -> int:
+        """Estimate the tokens one call costs: prompt (~4 chars/token), image and output."""
+        ocr_chars = min(len(ocr_text), 1000) if ocr_text else 0
+        return (len(self.vision_prompt) + ocr_chars) // 4 + IMAGE_TOKEN_ESTIMATE + self.max_tokens
+
+    async def update_frame_results(
         self,
         conn: asyncpg.Connection,
-        result: VisionResult,
+        results: list[VisionResult],
     ) -> None:
         """
-        Update the database with vision processing results.
+        Update the database with a batch of vision processing results.
+
+        All frames are written by one UPDATE joined against unnested arrays,
+        so a batch costs a single round trip. Failed frames keep their old
+        summary and are marked as error.
 
         Args:
             conn: asyncpg database connection.
-            result: Vision processing result.
+            results: Vision processing results.
         """
-        if result.error:
-            await conn.execute(
-                """
-                UPDATE frames
-                SET vision_status = $1
-                WHERE id = $2
-                """,
-                VISION_STATUS_ERROR,
-                result.frame_id,
-            )
-            logger.error(f"Frame {result.frame_id} marked as error: {result.error}")
+        if not results:
             return
 
-        await conn.execute(
-            """
-            UPDATE frames
-            SET vision_summary = $1, vision_status = $2
-            WHERE id = $3
-            """,
-            result.summary,
-            VISION_STATUS_VISION_DONE,
-            result.frame_id,
+        update = await self._prepared(conn, UPDATE_FRAME_RESULTS_SQL)
+        await update.fetch(
+            [result.frame_id for result in results],
+            [None if result.error else result.summary for result in results],
+            [VISION_STATUS_ERROR if result.error else VISION_STATUS_VISION_DONE for result in results],
         )
 
-        logger.info(
-            f"Frame {result.frame_id} processed: "
-            f"summary_len={len(result.summary) if result.summary else 0}"
-        )
+        # Per-frame success lines are only built when INFO is enabled
+        log_done = logger.isEnabledFor(logging.INFO)
+        for result in results:
+            if result.error:
+                logger.error(f"Frame {result.frame_id} marked as error: {result.error}")
+            elif log_done:
+                logger.info(
+                    f"Frame {result.frame_id} processed: "
+                    f"summary_len={len(result.summary) if result.summary else 0}"
+                )
+
+    def reusable_summary(self, frame: VisionFrameRecord) -> str | None:
+        """
+        Return a summary a low-information, near-duplicate frame can reuse.
+
+        Checks the frame captured just before it, then the summaries this
+        worker produced recently.
+        """
+        if (
+            self.dedupe_threshold is None
+            or frame.phash64 is None
+            or len(frame.ocr_text or "") >= self.dedupe_max_ocr_chars
+        ):
+            return None
+        if (
+            frame.prev_summary
+            and frame.prev_phash64 is not None
+            and _hamming64(frame.phash64, frame.prev_phash64) <= self.dedupe_threshold
+        ):
+            return frame.prev_summary
+        for phash64 in reversed(self._recent_summaries):
+            if _hamming64(frame.phash64, phash64) <= self.dedupe_threshold:
+                self._recent_summaries.move_to_end(phash64)
+                return self._recent_summaries[phash64]
+        return None
+
+    def _remember_summary(self, frame: VisionFrameRecord, summary: str) -> None:
+        if self.dedupe_threshold is None or frame.phash64 is None:
+            return
+        self._recent_summaries[frame.phash64] = summary
+        self._recent_summaries.move_to_end(frame.phash64)
+        if len(self._recent_summaries) > RECENT_SUMMARY_CACHE_SIZE:
+            self._recent_summaries.popitem(last=False)
 
     async def process_frame(self, frame: VisionFrameRecord) -> VisionResult:
         """
@@ -335,25 +663,34 @@ class VisionWorker:
             VisionResult with generated summary or error.
         """
         try:
-            # Load the image
-            image_result = self.load_image_base64(frame.image_ref)
-            if image_result is None:
-                return VisionResult(
-                    frame_id=frame.id,
-                    error=f"Could not load image: {frame.image_ref}",
-                )
-
-            image_data_uri, _ = image_result
+            reused = self.reusable_summary(frame)
+            if reused is not None:
+                logger.debug(f"Frame {frame.id} is a near-duplicate; reusing its summary")
+                return VisionResult(frame_id=frame.id, summary=reused)
+
+            if frame.image_ref.startswith(("http://", "https://")):
+                # The provider fetches remote images itself; nothing to read or encode
+                image_id = frame.image_ref
+            else:
+                # Read and encode in a worker thread so concurrent frames overlap their I/O
+                image_result = await asyncio.to_thread(self.load_image_base64, frame.image_ref)
+                if image_result is None:
+                    return VisionResult(
+                        frame_id=frame.id,
+                        error=f"{ERR_IMAGE_LOAD}: {frame.image_ref}",
+                    )
+                image_id, _ = image_result
 
             # Generate summary
-            summary = self.generate_summary(image_data_uri, frame.ocr_text)
+            summary = await self.generate_summary(image_id, frame.ocr_text)
 
             if summary is None:
                 return VisionResult(
                     frame_id=frame.id,
-                    error="LLM Vision API returned no summary",
+                    error=ERR_NO_SUMMARY,
                 )
 
+            self._remember_summary(frame, summary)
             return VisionResult(
                 frame_id=frame.id,
                 summary=summary,
@@ -366,79 +703,86 @@ class VisionWorker:
                 error=str(e),
             )
 
-    async def process_batch(self, conn: asyncpg.Connection) -> int:
+    async def process_batch(self, conn: asyncpg.Connection | None = None) -> int:
         """
         Process a batch of frames.
 
+        Without `conn`, connections come from the shared pool only for the
+        claim and the final write, each run through _with_retry; none is held
+        while the LLM calls run. A failed write is retried on its own, so it
+        never claims a second batch.
+
+        With `conn`, the claim and the write both run on it, unretried. As in
+        OCRWorker.process_batch, the write uses conn.transaction(), which
+        becomes a savepoint when `conn` is already in a transaction, so a caller
+        can run the batch inside its own transaction and roll it back.
+
         Args:
-            conn: asyncpg database connection.
+            conn: Optional asyncpg database connection.
 
         Returns:
             Number of frames processed.
         """
-        # Fetch OCR-done frames
-        frames = await self.fetch_ocr_done_frames(conn)
+        # Create the client before claiming, so a bad config leaves frames unclaimed
+        self._get_llm_client()
+
+        if conn is not None:
+            frames = await self.claim_frames(conn)
+        else:
+            frames = await self._with_retry(self.claim_frames)
         if not frames:
             return 0
 
         logger.info(f"Processing {len(frames)} frames with LLM Vision")
 
-        # Mark as vision processing
-        frame_ids = [f.id for f in frames]
-        await self.mark_frames_processing(conn, frame_ids)
+        # Process frames concurrently, up to max_concurrency LLM calls at once;
+        # each call is paced to the configured rate limits
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        # Process each frame with rate limiting
-        results = []
-        for i, frame in enumerate(frames):
-            result = await self.process_frame(frame)
-            results.append(result)
+        async def _bounded(frame: VisionFrameRecord) -> VisionResult:
+            async with semaphore:
+                return await self.process_frame(frame)
 
-            # Add delay between API calls to avoid rate limits
-            if i < len(frames) - 1:
-                await asyncio.sleep(self.rate_limit_delay)
+        results = await asyncio.gather(*(_bounded(frame) for frame in frames))
 
-        # Update results in a transaction
-        async with conn.transaction():
-            for result in results:
-                await self.update_frame_result(conn, result)
+        # Update all results in one statement
+        if conn is not None:
+            async with conn.transaction():
+                await self.update_frame_results(conn, results)
+        else:
+            await self._with_retry(partial(self.update_frame_results, results=results))
 
         return len(frames)
 
-    async def run_with_retry(self, conn: asyncpg.Connection) -> int:
+    async def run_with_retry(self, conn: asyncpg.Connection | None = None) -> int:
         """
         Run a processing cycle with retry logic for transient errors.
 
+        The claim and the write are retried separately by _with_retry, with the
+        same error classification as the pipeline in run(). A caller's `conn`
+        is passed through to process_batch and is not retried, since a failed
+        statement may have aborted the caller's transaction.
+
         Args:
-            conn: asyncpg database connection.
+            conn: Optional asyncpg database connection.
 
         Returns:
-            Number of frames processed.
+            Number of frames processed, or 0 if retries were exhausted.
         """
-        last_error = None
-        for attempt in range(self.max_retries):
-            try:
-                return await self.process_batch(conn)
-            except asyncpg.PostgresError as e:
-                last_error = e
-                delay = self.retry_delay * (2**attempt)
-                logger.warning(
-                    f"Database error (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                    f"Retrying in {delay}s"
-                )
-                await asyncio.sleep(delay)
-            except Exception as e:
-                logger.error(f"Unexpected error in processing cycle: {e}")
-                raise
-
-        logger.error(f"Max retries exceeded. Last error: {last_error}")
-        return 0
+        try:
+            return await self.process_batch(conn)
+        except (*RETRY_IMMEDIATELY_ERRORS, *RETRY_WITH_BACKOFF_ERRORS) as e:
+            logger.error(f"Max retries exceeded. Last error: {e}")
+            return 0
 
     async def run(self) -> None:
         """
         Main worker loop.
 
-        Continuously polls for OCR-processed frames and generates vision summaries.
-        Runs until stopped via the running flag or KeyboardInterrupt.
+        Runs a claim -> LLM -> write pipeline over OCR-processed frames: one task
+        claims frames, max_concurrency tasks summarize them, and one task writes
+        the summaries back in batches, so a slow LLM call only holds up its own
+        frame. Runs until stopped via the running flag or KeyboardInterrupt.
         
         TODO: Add integration test for the polling loop:
           - Test that worker continuously fetches OCR-done frames
@@ -455,7 +799,7 @@ class VisionWorker:
           - Run VisionWorker.run() for fixed duration
           - Verify all frames transition from status 2→4 (vision done)
           - Verify vision_summary is populated correctly
-          - Verify rate_limit_delay is respected between LLM calls
+          - Verify requests_per_minute is respected across LLM calls
           - Verify concurrent workers don't process same frame twice
           - Test with multiple LLM providers (gpt-4o, claude-3, etc.)
           - Measure latency and throughput (summaries/min)
@@ -476,27 +820,130 @@ class VisionWorker:
             self.running = False
             return
 
-        while self.running:
+        await warm_async_pool()
+
+        # Bounded queues cap how many claimed frames are in flight
+        claim_q: asyncio.Queue[VisionFrameRecord | None] = asyncio.Queue(
+            maxsize=self.batch_size * 2
+        )
+        write_q: asyncio.Queue[VisionResult | None] = asyncio.Queue(maxsize=self.batch_size * 2)
+        llm_tasks = [
+            asyncio.create_task(self._llm_stage(claim_q, write_q))
+            for _ in range(self.max_concurrency)
+        ]
+        writer = asyncio.create_task(self._write_stage(write_q))
+
+        try:
+            await self._claim_stage(claim_q)
+        except asyncio.CancelledError:
+            logger.info("Worker cancelled")
+            self.running = False
+        finally:
+            # Let frames already claimed finish, then stop each stage in order
+            for _ in llm_tasks:
+                await claim_q.put(None)
+            await asyncio.gather(*llm_tasks)
+            await write_q.put(None)
+            await writer
+
+        logger.info("Vision Worker stopped")
+
+    async def _with_retry(self, operation: Callable[[asyncpg.Connection], Awaitable[T]]) -> T:
+        """
+        Run `operation(conn)` with retries for transient database errors.
+
+        Each attempt checks out a fresh pooled connection. Errors are classified
+        as in OCRWorker._with_retry: serialization failures and deadlocks are
+        retried immediately, connection failures back off exponentially from
+        retry_delay, and anything else (e.g. a bad column or a constraint
+        violation) cannot succeed on retry and is raised.
+        """
+        for attempt in range(1, self.max_retries + 1):
             try:
                 async with get_db_connection() as conn:
-                    processed = await self.run_with_retry(conn)
+                    return await operation(conn)
+            except RETRY_IMMEDIATELY_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(
+                    f"Transaction conflict (attempt {attempt}/{self.max_retries}): {e}. "
+                    "Retrying"
+                )
+            except RETRY_WITH_BACKOFF_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_delay * (2 ** (attempt - 1))
+                delay += random.uniform(0, delay * 0.1)
+                logger.warning(
+                    f"Database connection error (attempt {attempt}/{self.max_retries}): {e}. "
+                    f"Retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable")  # the last attempt returns or raises
 
-                    if processed == 0:
-                        # No frames to process, wait before next poll
-                        await asyncio.sleep(self.poll_interval)
-                    else:
-                        # Processed frames, immediately check for more
-                        logger.info(f"Processed {processed} frames with vision")
+    async def _claim_stage(self, claim_q: "asyncio.Queue[VisionFrameRecord | None]") -> None:
+        """Claim OCR-done frames into `claim_q` until stopped, polling while idle."""
+        while self.running:
+            try:
+                frames = await self._with_retry(self.claim_frames)
+                if frames:
+                    logger.info(f"Processing {len(frames)} frames with LLM Vision")
+                    for frame in frames:
+                        # Blocks while the LLM stage is saturated (backpressure)
+                        await claim_q.put(frame)
+                    continue
+
+                # No frames to process, wait before next poll
+                if self.poll_interval:
+                    await asyncio.sleep(self.poll_interval)
 
             except asyncio.CancelledError:
-                logger.info("Worker cancelled")
-                self.running = False
-                break
+                raise
             except Exception as e:
-                logger.exception(f"Error in worker loop: {e}")
-                await asyncio.sleep(self.poll_interval)
+                logger.exception(f"Error claiming frames: {e}")
+                # At least retry_delay, so poll_interval=0 does not spin on errors
+                await asyncio.sleep(max(self.poll_interval, self.retry_delay))
 
-        logger.info("Vision Worker stopped")
+    async def _llm_stage(
+        self,
+        claim_q: "asyncio.Queue[VisionFrameRecord | None]",
+        write_q: "asyncio.Queue[VisionResult | None]",
+    ) -> None:
+        """Summarize frames from `claim_q` until a None sentinel arrives."""
+        while (frame := await claim_q.get()) is not None:
+            await write_q.put(await self.process_frame(frame))
+
+    async def _write_stage(self, write_q: "asyncio.Queue[VisionResult | None]") -> None:
+        """
+        Write summaries in batches of up to batch_size until a None sentinel arrives.
+
+        After the first result of a batch arrives, more are collected for at most
+        flush_interval seconds before the batch is written.
+        """
+        done = False
+        while not done:
+            result = await write_q.get()
+            if result is None:
+                break
+            results = [result]
+            deadline = time.monotonic() + self.flush_interval
+            while len(results) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    result = await asyncio.wait_for(write_q.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if result is None:
+                    done = True
+                    break
+                results.append(result)
+
+            try:
+                await self._with_retry(partial(self.update_frame_results, results=results))
+            except Exception as e:
+                logger.exception(f"Failed to store {len(results)} vision results: {e}")
 
     def stop(self) -> None:
         """Signal the worker to stop gracefully."""
@@ -537,11 +984,42 @@ async def main() -> None:
         default=150,
         help="Maximum tokens for LLM response (default: 150)",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=5,
+        help="Maximum concurrent LLM calls (default: 5)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=120.0,
+        help="Provider requests-per-minute limit, 0 to disable (default: 120)",
+    )
     parser.add_argument(
         "--rate-limit-delay",
         type=float,
-        default=0.5,
-        help="Delay between API calls in seconds (default: 0.5)",
+        default=None,
+        help="Deprecated: use --rpm. Seconds between LLM calls, mapped to 60/delay requests per minute",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=0,
+        help="Provider tokens-per-minute limit, 0 to disable (default: 0)",
+    )
+    parser.add_argument(
+        "--request-timeout",
+        type=float,
+        default=20.0,
+        help="Seconds before an LLM call is abandoned (default: 20)",
+    )
+    parser.add_argument(
+        "--dedupe-threshold",
+        type=int,
+        default=4,
+        help="Max phash bit distance for reusing a near-duplicate frame's summary, "
+        "negative to disable (default: 4)",
     )
     parser.add_argument(
         "--verbose",
@@ -564,6 +1042,11 @@ async def main() -> None:
         model=args.model,
         model_endpoint=args.model_endpoint,
         max_tokens=args.max_tokens,
+        max_concurrency=args.max_concurrency,
+        requests_per_minute=args.rpm or None,
+        tokens_per_minute=args.tpm or None,
+        request_timeout=args.request_timeout,
+        dedupe_threshold=args.dedupe_threshold if args.dedupe_threshold >= 0 else None,
         rate_limit_delay=args.rate_limit_delay,
     )
 
@@ -574,4 +1057,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
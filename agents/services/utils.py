@@ -1,8 +1,7 @@
-from functools import wraps
+from functools import lru_cache
 from typing import List, Optional
 
 import numpy as np
-import pytz
 from sqlalchemy import func
 
 from agents.constants import (
@@ -14,6 +13,21 @@ from agents.schemas.embedding_config import EmbeddingConfig
 from agents.settings import settings
 
 
+@lru_cache(maxsize=8)
+def _embedder_for(config_json: str):
+    return embedding_model(EmbeddingConfig.model_validate_json(config_json))
+
+
+def cached_embedding_model(embedding_config: EmbeddingConfig):
+    """
+    Return the embedding model for a config, reusing the instance across queries.
+
+    Building the model creates an API client (or loads local weights), which
+    would otherwise happen on every search.
+    """
+    return _embedder_for(embedding_config.model_dump_json())
+
+
 def build_query(
     base_query,
     search_field,
@@ -36,19 +50,18 @@ def build_query(
             assert query_text is not None, (
                 "query_text must be specified for vector search"
             )
-            embedded_text = embedding_model(embedding_config).get_text_embedding(
+            embedded_text = cached_embedding_model(embedding_config).get_text_embedding(
                 query_text
             )
-            embedded_text = np.array(embedded_text)
-            embedded_text = np.pad(
-                embedded_text,
-                (0, MAX_EMBEDDING_DIM - embedded_text.shape[0]),
-                mode="constant",
-            ).tolist()
+            # Zero-pad into a preallocated buffer; pgvector and adapt_array both
+            # bind float32 arrays directly, so no list conversion is needed
+            padded = np.zeros(MAX_EMBEDDING_DIM, dtype=np.float32)
+            padded[: len(embedded_text)] = embedded_text
+            embedded_text = padded
 
     main_query = base_query.order_by(None)
 
-    if embedded_text:
+    if embedded_text is not None and len(embedded_text) > 0:
         # Check which database type we're using
         if settings.agents_pg_uri_no_default:
             # PostgreSQL with pgvector - use direct cosine_distance method
@@ -138,12 +138,24 @@ class Settings(BaseSettings):
     pg_uri: Optional[str] = Field(
         default_pg_uri, env="AGENTS_PG_URI"
     )  # option to specify full uri
+    # Concurrency budget: each engine (sync, async) may open up to
+    # pg_pool_size + pg_max_overflow connections, shared by the OCR, vision and
+    # consolidator workers of one process. Keep the total across processes below
+    # the server's max_connections.
     pg_pool_size: int = 80  # Concurrent connections
     pg_max_overflow: int = 30  # Overflow limit
     pg_pool_timeout: int = 30  # Seconds to wait for a connection
     pg_pool_recycle: int = 1800  # When to recycle connections
+    pg_pool_use_lifo: bool = True  # Reuse the most recently released connection
+    pg_pool_status_interval: int = 30  # Seconds between pool status log lines (0 = off)
+    pg_statement_cache_size: int = 1024  # Prepared statements cached per asyncpg connection
+    pg_pool_warm_size: int = 2  # Async connections each worker opens at startup (0 = lazy)
     pg_echo: bool = False  # Logging
 
+    # OCR worker: extra Tesseract flags, e.g. "--oem 1 --psm 6" to skip page
+    # layout analysis on single-block captures (empty = Tesseract's defaults)
+    ocr_tesseract_config: str = ""
+
     # multi agent settings
     multi_agent_send_message_max_retries: int = 3
     multi_agent_send_message_timeout: int = 20 * 60